@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Measures restcord's request throughput, latency and CPU cost against the local fake Discord server.
+
+The server runs in its own process so the CPU time reported is the client's alone.
+
+Usage: python -m benchmarks.bench_load [--workload history members bulk-delete lookups] [--count 5000] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from functools import partial
+
+from restcord import Hooks, RateLimiter, RestCord
+from restcord.http import Route
+
+CHANNEL_ID = 381870553235193857
+GUILD_ID = 381870553235193856
+
+
+class Recorder(Hooks):
+
+    """Records the latency of every response and counts rate limits and retries."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.latencies = []
+        self.waits = []
+        self.ratelimits = 0
+        self.retries = 0
+
+    def on_response(self, route, status, elapsed, waited, bytes_in, bytes_out):
+        self.latencies.append(elapsed)
+        self.waits.append(waited)
+
+    def on_ratelimit(self, route, bucket, retry_after, is_global):
+        self.ratelimits += 1
+
+    def on_retry(self, route, attempt, delay, error):
+        self.retries += 1
+
+
+async def history(client: RestCord, count: int) -> None:
+    await client.channel_client.iter_messages(CHANNEL_ID, limit=count).count()
+
+
+async def members(client: RestCord, count: int) -> None:
+    await client.guild_client.iter_members(GUILD_ID, limit=count).count()
+
+
+async def bulk_delete(client: RestCord, count: int, message_ids) -> None:
+    await client.channel_client.delete_messages(CHANNEL_ID, message_ids)
+
+
+async def lookups(client: RestCord, count: int) -> None:
+    # Every lookup shares one rate limit bucket, so a tenth of the count keeps the run short.
+    calls = {user_id: partial(client.user_client.get_user, user_id) for user_id in range(GUILD_ID, GUILD_ID + max(1, count // 10))}
+    async for _, _, error in client.gather(calls, concurrency=50):
+        if error is not None:
+            raise error
+
+
+WORKLOADS = {
+    'history': history,
+    'members': members,
+    'bulk-delete': bulk_delete,
+    'lookups': lookups
+}
+
+
+def percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(args) -> subprocess.Popen:
+    port = free_port()
+    command = [
+        sys.executable, '-m', 'benchmarks.fake_discord', '--port', str(port),
+        '--messages', str(max(args.count, 1000)), '--members', str(max(args.count, 1000)),
+        '--latency', str(args.latency), '--jitter', str(args.jitter),
+        '--window-scale', str(args.window_scale), '--spurious-429', str(args.spurious_429)
+    ]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline or server.poll() is not None:
+                server.kill()
+                raise RuntimeError('The fake Discord server did not start.')
+            time.sleep(0.05)
+
+    Route.BASE = f'http://127.0.0.1:{port}/api'
+    return server
+
+
+async def run(name: str, args) -> dict:
+    recorder = Recorder()
+    # The fake server scales Discord's global limit of 50 requests per second by the same factor as its windows.
+    ratelimiter = RateLimiter(global_limit=max(1, int(50 / args.window_scale)))
+
+    async with RestCord('benchmark', ratelimiter=ratelimiter, hooks=[recorder], retry_jitter=0.5 * args.window_scale, max_retries=10) as client:
+        workload = WORKLOADS[name]
+        if name == 'bulk-delete':
+            messages = await client.channel_client.iter_messages(CHANNEL_ID, limit=args.count).flatten()
+            workload = partial(bulk_delete, message_ids=[m.id for m in messages])
+            recorder.clear()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        await workload(client, args.count)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    requests = len(recorder.latencies)
+    return {
+        'workload': name,
+        'requests': requests,
+        'seconds': wall,
+        'rps': requests / wall if wall else 0.0,
+        'p50': percentile(recorder.latencies, 0.5),
+        'p99': percentile(recorder.latencies, 0.99),
+        'wait': statistics.mean(recorder.waits) if recorder.waits else 0.0,
+        'cpu': cpu / requests if requests else 0.0,
+        '429s': recorder.ratelimits,
+        'retries': recorder.retries
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workload', nargs='+', choices=sorted(WORKLOADS), default=['history', 'members', 'bulk-delete', 'lookups'])
+    parser.add_argument('--count', type=int, default=5000, help='Items each workload reads, deletes or looks up.')
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds the server delays every response by.')
+    parser.add_argument('--jitter', type=float, default=0.01, help='Maximum random seconds added to the latency.')
+    parser.add_argument('--window-scale', type=float, default=0.01, help="Factor Discord's rate limit windows are scaled by.")
+    parser.add_argument('--spurious-429', type=float, default=0.0, help='Fraction of requests the server answers with a 429.')
+    args = parser.parse_args()
+
+    print(f'{"workload":>12} {"requests":>9} {"seconds":>8} {"req/s":>8} {"p50 ms":>8} {"p99 ms":>8} {"wait ms":>8} {"cpu us/req":>11} {"429s":>6} {"retries":>8}')
+    for name in args.workload:
+        # A fresh server for each workload, so that one workload's rate limits and deletions don't affect the next.
+        server = start_server(args)
+        try:
+            r = asyncio.run(run(name, args))
+        finally:
+            server.terminate()
+            server.wait()
+
+        print(f'{r["workload"]:>12} {r["requests"]:>9} {r["seconds"]:>8.2f} {r["rps"]:>8.1f} {r["p50"] * 1000:>8.2f} {r["p99"] * 1000:>8.2f} '
+              f'{r["wait"] * 1000:>8.2f} {r["cpu"] * 1e6:>11.0f} {r["429s"]:>6} {r["retries"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
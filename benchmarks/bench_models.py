@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""Measures how long building models from payloads takes and how much memory the models hold.
+
+Usage: python -m benchmarks.bench_models [--case messages members guild] [--repeat 5] [--lazy] [--touch] [--kwargs]
+                                         [--profile | --tracemalloc] [--record DIR | --fixtures DIR]
+                                         [--save FILE | --check FILE --tolerance 0.2]
+
+Payloads are generated by benchmarks.payloads unless ``--fixtures`` names a directory of JSON files, one per case,
+such as responses recorded from Discord or written by ``--record``. ``--save`` writes the timings to a JSON file and
+``--check`` compares them with one, exiting with status 1 when a case is slower by more than the tolerance.
+
+Memory is measured from the payloads encoded as JSON: they are decoded and built into models, then dropped, so
+``bytes/model`` includes any payload a model keeps alive, such as the ``_data`` of models built with ``--lazy``. ``payload B``
+is the size of one decoded payload for comparison.
+"""
+import argparse
+import cProfile
+import gc
+import json
+import os
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+
+from restcord import Guild, Member, MemberTable, Message, MessageTable, Role, utils
+from restcord.model import lazy
+
+from . import payloads
+
+# Set by --kwargs to time building models with keyword arguments instead of from_dict.
+KWARGS = False
+# Set by --lazy to build models lazily.
+LAZY = False
+
+
+def build_messages(data):
+    if KWARGS:
+        return [Message(**m) for m in data]
+    return [Message.from_dict(m) for m in data]
+
+
+def build_members(data):
+    if KWARGS:
+        return [Member(**m) for m in data]
+    return [Member.from_dict(m) for m in data]
+
+
+def build_guild(data):
+    if KWARGS:
+        return [Guild(**g) for g in data]
+    return [Guild.from_dict(g) for g in data]
+
+
+def build_roles(data):
+    if KWARGS:
+        return [Role(**r) for r in data]
+    return [Role.from_dict(r) for r in data]
+
+
+def build_member_table(data):
+    return MemberTable(data)
+
+
+def build_message_table(data):
+    return MessageTable(data)
+
+
+def touch_messages(models):
+    for m in models:
+        m.author, m.timestamp, m.edited_timestamp
+
+
+def touch_members(models):
+    for m in models:
+        m.joined_at, m.premium_since
+
+
+def touch_guild(models):
+    for g in models:
+        g.roles, g.emojis
+
+
+# Name: (build, touch the lazily built fields, generate the payloads, number of payloads).
+CASES = {
+    'messages': (build_messages, touch_messages, lambda n: payloads.messages(n), 10_000),
+    'members': (build_members, touch_members, lambda n: payloads.members(n), 100_000),
+    'guild': (build_guild, touch_guild, lambda n: [payloads.guild(random.Random(i), payloads.snowflake(payloads.START, i)) for i in range(n)], 100),
+    'roles': (build_roles, None, lambda n: payloads.guild(random.Random(0), 1, roles=n)['roles'], 250),
+    'message-table': (build_message_table, None, lambda n: payloads.messages(n), 10_000),
+    'member-table': (build_member_table, None, lambda n: payloads.members(n), 100_000)
+}
+
+
+def load(name: str, args) -> list:
+    _, _, generate, count = CASES[name]
+    if args.fixtures:
+        with open(os.path.join(args.fixtures, f'{name}.json'), 'rb') as f:
+            return json.load(f)
+    return generate(args.count or count)
+
+
+def run(build, touch, data, touch_fields: bool):
+    with lazy(LAZY):
+        models = build(data)
+    if touch_fields and touch is not None:
+        touch(models)
+    return models
+
+
+def retained(encoded, build=None, touch=None, touch_fields: bool = False):
+    """Decodes the payloads, builds the models from them and drops the payloads, returning the bytes still allocated
+    and the peak. Payloads that lazily built models keep alive are counted, as they would be when reading responses."""
+    gc.collect()
+    tracemalloc.start()
+    data = utils.from_json(encoded)
+    models = data if build is None else run(build, touch, data, touch_fields)
+    del data
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return current, peak
+
+
+def measure(name: str, data: list, args) -> dict:
+    build, touch, _, _ = CASES[name]
+
+    best = float('inf')
+    for _ in range(args.repeat):
+        gc.collect()
+        start = time.perf_counter()
+        models = run(build, touch, data, args.touch)
+        best = min(best, time.perf_counter() - start)
+        del models
+
+    encoded = utils.to_json(data)
+    payloads_retained, _ = retained(encoded)
+    current, peak = retained(encoded, build, touch, args.touch)
+
+    return {
+        'count': len(data),
+        'seconds': best,
+        'ns_per_model': best / len(data) * 1e9,
+        'payload_bytes_per_model': payloads_retained / len(data),
+        'retained_bytes_per_model': current / len(data),
+        'peak_bytes': peak
+    }
+
+
+def profile(name: str, data: list, args) -> None:
+    build, touch, _, _ = CASES[name]
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run(build, touch, data, args.touch)
+    profiler.disable()
+    pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(25)
+
+
+def allocations(name: str, data: list, args) -> None:
+    build, touch, _, _ = CASES[name]
+    gc.collect()
+    tracemalloc.start(25)
+    models = run(build, touch, data, args.touch)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del models
+
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    for stat in snapshot.statistics('lineno')[:25]:
+        print(stat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--case', nargs='+', choices=sorted(CASES), default=sorted(CASES))
+    parser.add_argument('--count', type=int, default=0, help='Payloads per case instead of the default for the case.')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs to time; the best is reported.')
+    parser.add_argument('--lazy', action='store_true', help='Build nested models and timestamps lazily.')
+    parser.add_argument('--touch', action='store_true', help='Also access the fields that are built lazily.')
+    parser.add_argument('--kwargs', action='store_true', help='Build models with Model(**payload) instead of Model.from_dict(payload).')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--profile', action='store_true', help='Print a cProfile report of one run instead of timing.')
+    mode.add_argument('--tracemalloc', action='store_true', help='Print the top allocation sites of one run instead of timing.')
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--fixtures', help='Load the payloads from <case>.json files in this directory.')
+    fixtures.add_argument('--record', help='Write the generated payloads to <case>.json files in this directory and exit.')
+    parser.add_argument('--save', help='Write the results to this JSON file.')
+    parser.add_argument('--check', help='Compare the results with this JSON file.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='The fraction a case may be slower by before --check fails.')
+    args = parser.parse_args()
+
+    global KWARGS, LAZY
+    KWARGS = args.kwargs
+    LAZY = args.lazy
+
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+        for name in args.case:
+            with open(os.path.join(args.record, f'{name}.json'), 'w') as f:
+                json.dump(load(name, args), f)
+        return
+
+    if args.profile or args.tracemalloc:
+        for name in args.case:
+            print(f'== {name}')
+            (profile if args.profile else allocations)(name, load(name, args), args)
+        return
+
+    results = {}
+    print(f'{"case":>13} {"models":>8} {"ms":>9} {"ns/model":>9} {"payload B":>10} {"bytes/model":>12} {"peak MiB":>9}')
+    for name in args.case:
+        r = results[name] = measure(name, load(name, args), args)
+        print(f'{name:>13} {r["count"]:>8} {r["seconds"] * 1000:>9.1f} {r["ns_per_model"]:>9.0f} {r["payload_bytes_per_model"]:>10.0f} '
+              f'{r["retained_bytes_per_model"]:>12.0f} {r["peak_bytes"] / 2 ** 20:>9.1f}')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.check:
+        with open(args.check) as f:
+            baseline = json.load(f)
+
+        failed = False
+        for name, r in results.items():
+            if name not in baseline:
+                continue
+            ratio = r['ns_per_model'] / baseline[name]['ns_per_model']
+            status = 'ok'
+            if ratio > 1 + args.tolerance:
+                status = 'REGRESSION'
+                failed = True
+            print(f'{name:>13} {ratio:>6.2f}x of baseline {status}')
+
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
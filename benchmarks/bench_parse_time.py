@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Compares utils.parse_time with the regular expression parser it replaced.
+
+Usage: python -m benchmarks.bench_parse_time [--count 100000] [--repeat 5]
+"""
+import argparse
+import random
+import re
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from restcord import utils
+
+
+def parse_time_regex(timestamp):
+    """The previous implementation of utils.parse_time, kept for comparison."""
+    if timestamp:
+        return datetime(*map(int, re.split(r'[^\d]', timestamp.replace('+00:00', ''))))
+    return None
+
+
+def make_timestamps(count: int):
+    """Builds timestamps in the format Discord sends for messages, some with and some without microseconds."""
+    rng = random.Random(0)
+    start = datetime(2015, 5, 13, tzinfo=timezone.utc)
+    timestamps = []
+    for _ in range(count):
+        moment = start + timedelta(seconds=rng.randrange(200_000_000), microseconds=rng.randrange(1000) * 1000)
+        timestamps.append(moment.isoformat() if rng.random() < 0.9 else moment.replace(microsecond=0).isoformat())
+    return timestamps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000, help='Timestamps per batch.')
+    parser.add_argument('--repeat', type=int, default=5, help='Batches to time; the best is reported.')
+    args = parser.parse_args()
+
+    timestamps = make_timestamps(args.count)
+
+    results = {}
+    for name, parse in (('regex', parse_time_regex), ('parse_time', utils.parse_time)):
+        best = min(timeit.repeat(lambda: [parse(t) for t in timestamps], number=1, repeat=args.repeat))
+        results[name] = best
+        print(f'{name:>12}: {best * 1000:8.1f} ms per {args.count} timestamps ({best / args.count * 1e9:6.0f} ns each)')
+
+    print(f'{"speedup":>12}: {results["regex"] / results["parse_time"]:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""A local stand-in for Discord's API, serving the routes used by restcord's clients.
+
+Responses carry ``X-Ratelimit-*`` headers from per-bucket windows like Discord's, requests over a limit get 429
+responses, and latency can be injected. Windows can be scaled down so benchmarks hit rate limits without waiting
+seconds for them to reset.
+
+Usage: python -m benchmarks.fake_discord [--port 8080] [--latency 0.02] [--window-scale 0.01]
+"""
+import argparse
+import asyncio
+import bisect
+import hashlib
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+
+from restcord.http import Route
+
+from . import payloads
+
+
+class Window:
+
+    __slots__ = ('limit', 'remaining', 'reset_at')
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = 0.0
+
+
+class FakeDiscord:
+
+    """An aiohttp application emulating Discord's API.
+
+    Parameters
+    ------------
+    messages: :class:`int`
+        The number of messages in each channel's history.
+    members: :class:`int`
+        The number of members in each guild.
+    latency: :class:`float`
+        The number of seconds every response is delayed by.
+    jitter: :class:`float`
+        The maximum number of random seconds added to the latency.
+    window_scale: :class:`float`
+        How much shorter rate limit windows are than Discord's, e.g. ``0.01`` turns 5 requests per 5 seconds into 5
+        requests per 50 milliseconds. The global limit of 50 requests per second is scaled the same way.
+    spurious_429: :class:`float`
+        The fraction of requests answered with a 429 even though their bucket has requests remaining, as happens when
+        another process shares the token.
+    seed: :class:`int`
+        The seed of the generated data, latency jitter and spurious 429s.
+
+    Attributes
+    ------------
+    requests: :class:`int`
+        The number of requests received.
+    ratelimited: :class:`int`
+        The number of 429 responses sent.
+    """
+
+    # Requests per window and window length in seconds, by method and route template, like Discord's buckets.
+    LIMITS = {
+        'GET /channels/{id}/messages': (5, 5.0),
+        'DELETE /channels/{id}/messages/{id}': (5, 1.0),
+        'POST /channels/{id}/messages/bulk-delete': (1, 1.0),
+        'GET /guilds/{id}/members': (10, 10.0)
+    }
+    DEFAULT_LIMIT = (5, 5.0)
+    GLOBAL_LIMIT = 50
+
+    def __init__(self, messages: int = 10_000, members: int = 10_000, latency: float = 0.0, jitter: float = 0.0, window_scale: float = 1.0,
+                 spurious_429: float = 0.0, seed: int = 0) -> None:
+        self.message_count = messages
+        self.member_count = members
+        self.latency = latency
+        self.jitter = jitter
+        self.window_scale = window_scale
+        self.spurious_429 = spurious_429
+        self.requests = 0
+        self.ratelimited = 0
+
+        self.__rng = random.Random(seed)
+        self.__seed = seed
+        self.__windows = {}
+        self.__global = Window(self.GLOBAL_LIMIT)
+        self.__messages = {}
+        self.__members = None
+        self.__runner = None
+
+        self.app = web.Application(middlewares=[self.__middleware])
+        self.app.router.add_routes([
+            web.get('/api/channels/{channel_id}', self.get_channel),
+            web.delete('/api/channels/{channel_id}', self.get_channel),
+            web.get('/api/channels/{channel_id}/messages', self.get_messages),
+            web.get('/api/channels/{channel_id}/messages/{message_id}', self.get_message),
+            web.delete('/api/channels/{channel_id}/messages/{message_id}', self.delete_message),
+            web.post('/api/channels/{channel_id}/messages/bulk-delete', self.bulk_delete_messages),
+            web.get('/api/channels/{channel_id}/messages/{message_id}/reactions/{emoji}', self.get_reactions),
+            web.put('/api/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me', self.no_content),
+            web.delete('/api/channels/{channel_id}/messages/{message_id}/reactions', self.no_content),
+            web.delete('/api/channels/{channel_id}/messages/{message_id}/reactions/{emoji}', self.no_content),
+            web.delete('/api/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}', self.no_content),
+            web.get('/api/channels/{channel_id}/invites', self.get_invites),
+            web.post('/api/channels/{channel_id}/invites', self.create_invite),
+            web.get('/api/channels/{channel_id}/webhooks', self.get_webhooks),
+            web.get('/api/guilds/{guild_id}', self.get_guild),
+            web.get('/api/guilds/{guild_id}/preview', self.get_guild),
+            web.get('/api/guilds/{guild_id}/channels', self.get_channels),
+            web.get('/api/guilds/{guild_id}/members', self.get_members),
+            web.get('/api/guilds/{guild_id}/members/{user_id}', self.get_member),
+            web.get('/api/guilds/{guild_id}/roles', self.get_roles),
+            web.get('/api/guilds/{guild_id}/bans', self.get_bans),
+            web.get('/api/guilds/{guild_id}/bans/{user_id}', self.get_ban),
+            web.get('/api/guilds/{guild_id}/emojis', self.get_emojis),
+            web.get('/api/guilds/{guild_id}/emojis/{emoji_id}', self.get_emoji),
+            web.delete('/api/guilds/{guild_id}/emojis/{emoji_id}', self.no_content),
+            web.get('/api/guilds/{guild_id}/webhooks', self.get_webhooks),
+            web.get('/api/invites/{code}', self.get_invite),
+            web.delete('/api/invites/{code}', self.get_invite),
+            web.get('/api/users/{user_id}', self.get_user),
+            web.get('/api/voice/regions', self.get_voice_regions),
+            web.get('/api/webhooks/{webhook_id}', self.get_webhook),
+            web.get('/api/webhooks/{webhook_id}/{token}', self.get_webhook),
+            web.delete('/api/webhooks/{webhook_id}', self.no_content),
+            web.delete('/api/webhooks/{webhook_id}/{token}', self.no_content)
+        ])
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """|coro| Starts serving and returns the base URL to set as :attr:`Route.BASE`."""
+        self.__runner = web.AppRunner(self.app)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f'http://{host}:{port}/api'
+
+    async def stop(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+
+    # Rate limits and latency
+
+    def __take(self, window: Window, length: float, now: float):
+        if window.reset_at <= now:
+            window.remaining = window.limit
+            window.reset_at = now + length
+        if window.remaining == 0:
+            return window.reset_at - now
+        window.remaining -= 1
+        return None
+
+    @web.middleware
+    async def __middleware(self, request, handler):
+        self.requests += 1
+
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self.__rng.uniform(0, self.jitter))
+
+        # Route works out the bucket and major parameter the same way restcord does.
+        route = Route(request.method, request.path[len('/api'):])
+        key = f'{request.method} {route.template}'
+        limit, length = self.LIMITS.get(key, self.DEFAULT_LIMIT)
+        length *= self.window_scale
+        bucket_hash = hashlib.md5(key.encode()).hexdigest()[:16]
+        window = self.__windows.get(route.bucket)
+        if window is None:
+            window = self.__windows[route.bucket] = Window(limit)
+
+        now = time.monotonic()
+        retry_after = self.__take(self.__global, self.window_scale, now)
+        if retry_after is not None:
+            return self.__ratelimited(retry_after, True)
+
+        if self.spurious_429 and self.__rng.random() < self.spurious_429:
+            return self.__ratelimited(length / limit, False)
+
+        retry_after = self.__take(window, length, now)
+        if retry_after is not None:
+            return self.__ratelimited(retry_after, False)
+
+        response = await handler(request)
+        reset_after = window.reset_at - now
+        response.headers.update({
+            'X-Ratelimit-Limit': str(window.limit),
+            'X-Ratelimit-Remaining': str(window.remaining),
+            'X-Ratelimit-Reset': f'{time.time() + reset_after:.3f}',
+            'X-Ratelimit-Reset-After': f'{reset_after:.3f}',
+            'X-Ratelimit-Bucket': bucket_hash
+        })
+        return response
+
+    def __ratelimited(self, retry_after: float, is_global: bool):
+        self.ratelimited += 1
+        headers = {'Retry-After': f'{retry_after:.3f}'}
+        if is_global:
+            headers['X-Ratelimit-Global'] = 'true'
+        # The API version restcord targets reports retry_after in the body in milliseconds.
+        return web.json_response({'message': 'You are being rate limited.', 'retry_after': math.ceil(retry_after * 1000), 'global': is_global},
+                                 status=429, headers=headers)
+
+    # Data
+
+    def __history(self, channel_id: int) -> list:
+        """Gets the IDs of a channel's messages, oldest first. Deleted messages are removed from the list."""
+        history = self.__messages.get(channel_id)
+        if history is None:
+            # One message every 7 seconds, ending now, so the newest messages can be bulk deleted.
+            start = datetime.now(timezone.utc) - timedelta(seconds=self.message_count * 7)
+            history = self.__messages[channel_id] = [payloads.snowflake(start + timedelta(seconds=i * 7), i) for i in range(self.message_count)]
+        return history
+
+    def __member_ids(self) -> list:
+        if self.__members is None:
+            self.__members = [payloads.snowflake(payloads.START + timedelta(seconds=i), i) for i in range(self.member_count)]
+        return self.__members
+
+    def __message(self, channel_id: int, message_id: int) -> dict:
+        rng = random.Random(message_id ^ self.__seed)
+        return payloads.message(rng, message_id, channel_id, payloads.snowflake(payloads.START, rng.randrange(50)))
+
+    def __member(self, user_id: int) -> dict:
+        return payloads.member(random.Random(user_id ^ self.__seed), user_id)
+
+    @staticmethod
+    def __limit(request, default: int, maximum: int) -> int:
+        return max(1, min(int(request.query.get('limit', default)), maximum))
+
+    # Handlers
+
+    async def no_content(self, request):
+        return web.Response(status=204)
+
+    async def get_channel(self, request):
+        channel_id = int(request.match_info['channel_id'])
+        return web.json_response(payloads.channel(random.Random(channel_id), channel_id, 1, 0))
+
+    async def get_messages(self, request):
+        channel_id = int(request.match_info['channel_id'])
+        limit = self.__limit(request, 50, 100)
+        history = self.__history(channel_id)
+        query = request.query
+
+        if 'after' in query:
+            start = bisect.bisect_right(history, int(query['after']))
+            ids = history[start:start + limit][::-1]
+        elif 'before' in query:
+            end = bisect.bisect_left(history, int(query['before']))
+            ids = history[max(0, end - limit):end][::-1]
+        else:
+            ids = history[-limit:][::-1]
+
+        return web.json_response([self.__message(channel_id, message_id) for message_id in ids])
+
+    async def get_message(self, request):
+        channel_id, message_id = int(request.match_info['channel_id']), int(request.match_info['message_id'])
+        history = self.__history(channel_id)
+        index = bisect.bisect_left(history, message_id)
+        if index == len(history) or history[index] != message_id:
+            return web.json_response({'message': 'Unknown Message', 'code': 10008}, status=404)
+        return web.json_response(self.__message(channel_id, message_id))
+
+    async def delete_message(self, request):
+        channel_id, message_id = int(request.match_info['channel_id']), int(request.match_info['message_id'])
+        history = self.__history(channel_id)
+        index = bisect.bisect_left(history, message_id)
+        if index == len(history) or history[index] != message_id:
+            return web.json_response({'message': 'Unknown Message', 'code': 10008}, status=404)
+        del history[index]
+        return web.Response(status=204)
+
+    async def bulk_delete_messages(self, request):
+        channel_id = int(request.match_info['channel_id'])
+        ids = set(int(m) for m in (await request.json())['messages'])
+        if not 2 <= len(ids) <= 100:
+            return web.json_response({'message': 'Invalid Form Body', 'code': 50035}, status=400)
+        history = self.__history(channel_id)
+        history[:] = [m for m in history if m not in ids]
+        return web.Response(status=204)
+
+    async def get_reactions(self, request):
+        limit = self.__limit(request, 25, 100)
+        ids = self.__member_ids()
+        start = bisect.bisect_right(ids, int(request.query.get('after', 0)))
+        return web.json_response([self.__member(user_id)['user'] for user_id in ids[start:start + limit]])
+
+    async def get_members(self, request):
+        limit = self.__limit(request, 1, 1000)
+        ids = self.__member_ids()
+        start = bisect.bisect_right(ids, int(request.query.get('after', 0)))
+        return web.json_response([self.__member(user_id) for user_id in ids[start:start + limit]])
+
+    async def get_member(self, request):
+        return web.json_response(self.__member(int(request.match_info['user_id'])))
+
+    async def get_guild(self, request):
+        guild_id = int(request.match_info['guild_id'])
+        return web.json_response(payloads.guild(random.Random(guild_id), guild_id))
+
+    async def get_channels(self, request):
+        guild_id = int(request.match_info['guild_id'])
+        rng = random.Random(guild_id)
+        return web.json_response([payloads.channel(rng, guild_id + i, guild_id, i) for i in range(1, 51)])
+
+    async def get_roles(self, request):
+        guild_id = int(request.match_info['guild_id'])
+        return web.json_response(payloads.guild(random.Random(guild_id), guild_id)['roles'])
+
+    async def get_emojis(self, request):
+        guild_id = int(request.match_info['guild_id'])
+        return web.json_response(payloads.guild(random.Random(guild_id), guild_id)['emojis'])
+
+    async def get_emoji(self, request):
+        emoji_id = int(request.match_info['emoji_id'])
+        return web.json_response(payloads.emoji(random.Random(emoji_id), emoji_id))
+
+    async def get_bans(self, request):
+        return web.json_response([{'reason': None, 'user': self.__member(user_id)['user']} for user_id in self.__member_ids()[:100]])
+
+    async def get_ban(self, request):
+        return web.json_response({'reason': 'spam', 'user': self.__member(int(request.match_info['user_id']))['user']})
+
+    def __invite(self, code: str) -> dict:
+        rng = random.Random(code)
+        guild = payloads.guild(rng, payloads.snowflake(payloads.START, 7), roles=1, emojis=0)
+        return {
+            'code': code,
+            'guild': guild,
+            'channel': payloads.channel(rng, payloads.snowflake(payloads.START, 8), int(guild['id']), 0),
+            'inviter': payloads.user(rng, payloads.snowflake(payloads.START, 9)),
+            'approximate_member_count': guild['approximate_member_count'],
+            'approximate_presence_count': guild['approximate_presence_count']
+        }
+
+    async def get_invite(self, request):
+        return web.json_response(self.__invite(request.match_info['code']))
+
+    async def get_invites(self, request):
+        return web.json_response([self.__invite(payloads.name(random.Random(i), 8, 8)) for i in range(10)])
+
+    async def create_invite(self, request):
+        return web.json_response(self.__invite(payloads.name(self.__rng, 8, 8)))
+
+    def __webhook(self, webhook_id: int) -> dict:
+        rng = random.Random(webhook_id)
+        return {
+            'id': str(webhook_id),
+            'type': 1,
+            'guild_id': '1',
+            'channel_id': '1',
+            'user': payloads.user(rng, payloads.snowflake(payloads.START, 9)),
+            'name': payloads.name(rng),
+            'avatar': None,
+            'token': payloads.name(rng, 68, 68)
+        }
+
+    async def get_webhook(self, request):
+        return web.json_response(self.__webhook(int(request.match_info['webhook_id'])))
+
+    async def get_webhooks(self, request):
+        return web.json_response([self.__webhook(payloads.snowflake(payloads.START, i)) for i in range(10)])
+
+    async def get_user(self, request):
+        user_id = int(request.match_info['user_id'])
+        return web.json_response(payloads.user(random.Random(user_id), user_id))
+
+    async def get_voice_regions(self, request):
+        return web.json_response([
+            {'id': region, 'name': region.title(), 'vip': False, 'optimal': region == 'europe', 'deprecated': False, 'custom': False}
+            for region in ('europe', 'us-east', 'us-west', 'singapore', 'sydney')
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--messages', type=int, default=10_000, help='Messages in each channel.')
+    parser.add_argument('--members', type=int, default=10_000, help='Members in each guild.')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds every response is delayed by.')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Maximum random seconds added to the latency.')
+    parser.add_argument('--window-scale', type=float, default=1.0, help='Factor rate limit windows are scaled by.')
+    parser.add_argument('--spurious-429', type=float, default=0.0, help='Fraction of requests answered with a 429.')
+    args = parser.parse_args()
+
+    server = FakeDiscord(args.messages, args.members, args.latency, args.jitter, args.window_scale, args.spurious_429)
+    web.run_app(server.app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
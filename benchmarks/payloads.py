@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Builds deterministic payloads shaped like the ones Discord's API returns, for the benchmarks and the fake server."""
+import random
+import string
+from datetime import datetime, timedelta, timezone
+
+from restcord import utils
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def snowflake(when: datetime, increment: int = 0) -> int:
+    """Makes a snowflake for a time, with ``increment`` in its low bits so several IDs can share a millisecond."""
+    return utils.time_snowflake(when) | (increment & 0x3FFFFF)
+
+
+def timestamp(when: datetime) -> str:
+    return when.isoformat()
+
+
+def name(rng: random.Random, low: int = 3, high: int = 16) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase + string.digits + '_', k=rng.randint(low, high)))
+
+
+def user(rng: random.Random, user_id: int) -> dict:
+    return {
+        'id': str(user_id),
+        'username': name(rng),
+        'discriminator': f'{rng.randrange(10000):04d}',
+        'avatar': rng.choice((None, f'{rng.getrandbits(128):032x}')),
+        'public_flags': rng.choice((0, 0, 0, 64, 128, 256))
+    }
+
+
+def member(rng: random.Random, user_id: int, roles=()) -> dict:
+    joined = START + timedelta(seconds=rng.randrange(100_000_000), microseconds=rng.randrange(1_000_000))
+    return {
+        'user': user(rng, user_id),
+        'nick': rng.choice((None, None, name(rng))),
+        'roles': [str(r) for r in rng.sample(roles, min(len(roles), rng.randrange(4)))],
+        'joined_at': timestamp(joined),
+        'premium_since': timestamp(joined + timedelta(days=30)) if rng.random() < 0.05 else None,
+        'deaf': False,
+        'mute': False
+    }
+
+
+def message(rng: random.Random, message_id: int, channel_id: int, author_id: int) -> dict:
+    sent = utils.snowflake_time(message_id)
+    return {
+        'id': str(message_id),
+        'channel_id': str(channel_id),
+        'type': 0,
+        'content': ' '.join(name(rng) for _ in range(rng.randrange(1, 20))),
+        'author': user(random.Random(author_id), author_id),
+        'timestamp': timestamp(sent),
+        'edited_timestamp': timestamp(sent + timedelta(minutes=5)) if rng.random() < 0.1 else None,
+        'tts': False,
+        'mention_everyone': False,
+        'mentions': [],
+        'mention_roles': [],
+        'attachments': [],
+        'embeds': [],
+        'pinned': rng.random() < 0.01
+    }
+
+
+def role(rng: random.Random, role_id: int, position: int) -> dict:
+    permissions = rng.getrandbits(31)
+    return {
+        'id': str(role_id),
+        'name': name(rng),
+        'color': rng.getrandbits(24),
+        'hoist': rng.random() < 0.2,
+        'position': position,
+        'permissions': permissions,
+        'permissions_new': str(permissions),
+        'managed': False,
+        'mentionable': rng.random() < 0.5
+    }
+
+
+def emoji(rng: random.Random, emoji_id: int) -> dict:
+    return {
+        'id': str(emoji_id),
+        'name': name(rng),
+        'roles': [],
+        'require_colons': True,
+        'managed': False,
+        'animated': rng.random() < 0.2,
+        'available': True
+    }
+
+
+def channel(rng: random.Random, channel_id: int, guild_id: int, position: int) -> dict:
+    return {
+        'id': str(channel_id),
+        'guild_id': str(guild_id),
+        'name': name(rng),
+        'type': 0,
+        'position': position,
+        'permission_overwrites': [
+            {'id': str(guild_id), 'type': 'role', 'allow': 0, 'deny': 1024, 'allow_new': '0', 'deny_new': '1024'}
+        ],
+        'parent_id': None,
+        'last_message_id': str(snowflake(START + timedelta(days=300))),
+        'topic': name(rng, 10, 60),
+        'nsfw': False,
+        'rate_limit_per_user': 0
+    }
+
+
+def guild(rng: random.Random, guild_id: int, roles: int = 250, emojis: int = 50) -> dict:
+    return {
+        'id': str(guild_id),
+        'name': name(rng),
+        'icon': f'{rng.getrandbits(128):032x}',
+        'splash': None,
+        'discovery_splash': None,
+        'owner_id': str(snowflake(START, 1)),
+        'region': 'europe',
+        'afk_channel_id': None,
+        'afk_timeout': 300,
+        'verification_level': 1,
+        'default_message_notifications': 1,
+        'explicit_content_filter': 2,
+        'roles': [role(rng, guild_id if i == 0 else snowflake(START, guild_id + i), i) for i in range(roles)],
+        'emojis': [emoji(rng, snowflake(START + timedelta(days=1), i)) for i in range(emojis)],
+        'features': ['COMMUNITY', 'NEWS'],
+        'mfa_level': 1,
+        'application_id': None,
+        'system_channel_id': None,
+        'system_channel_flags': 0,
+        'rules_channel_id': None,
+        'max_members': 250000,
+        'vanity_url_code': None,
+        'description': None,
+        'banner': None,
+        'premium_tier': 1,
+        'premium_subscription_count': 4,
+        'preferred_locale': 'en-US',
+        'public_updates_channel_id': None,
+        'max_video_channel_users': 25,
+        'approximate_member_count': 100000,
+        'approximate_presence_count': 20000
+    }
+
+
+def messages(count: int, channel_id: int = 1, seed: int = 0) -> list:
+    """Builds ``count`` messages from 50 authors, newest first like a page of channel history."""
+    rng = random.Random(seed)
+    authors = [snowflake(START, i) for i in range(50)]
+    ids = [snowflake(START + timedelta(seconds=i * 7), i) for i in range(count)]
+    return [message(rng, message_id, channel_id, rng.choice(authors)) for message_id in reversed(ids)]
+
+
+def members(count: int, seed: int = 0) -> list:
+    """Builds ``count`` members in order of their user ID, like a page of a guild's members."""
+    rng = random.Random(seed)
+    roles = [snowflake(START, i) for i in range(1, 20)]
+    return [member(rng, snowflake(START + timedelta(seconds=i), i), roles) for i in range(count)]
@@ -5,8 +5,10 @@ __copyright__ = 'Copyright 2020 (c) Lethys'
 __version__ = '0.0.6'
 
 from .ban import Ban
+from .cache import ResponseCache
 from .channel import Channel
 from .client import RestCord
+from .columns import MemberTable, MessageTable
 from .emoji import Emoji
 from .errors import (
     BadGateway,
@@ -18,10 +20,16 @@ from .errors import (
     RateLimited
 )
 from .guild import Guild, GuildPreview
+from .identity import IdentityMap
+from .http import ConnectionPool
 from .invite import Invite
 from .member import Member
 from .message import Message
+from .metrics import Hooks, MetricsCollector
+from .ratelimit import RateLimiter
 from .role import Role
+from .scheduler import Priority, RequestScheduler
+from .stream import JSONArrayDecoder
 from .user import User
 from .voice import VoiceRegion
 from .webhook import Webhook
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from .model import Model
 from .user import User
 
 __all__ = (
@@ -6,7 +7,7 @@ __all__ = (
 )
 
 
-class Ban:
+class Ban(Model):
 
     """
     Model depicting a Discord ban object.
@@ -14,10 +15,9 @@ class Ban:
 
     __slots__ = ('reason', 'user')
 
-    def __init__(self, **kwargs):
-
-        self.reason = kwargs.get('reason')
-        self.user = User(**kwargs.get('user'))
+    def _update(self, data) -> None:
+        self.reason = data.get('reason')
+        self.user = User.from_dict(data.get('user'))
 
     def __str__(self):
         return f'<{type(self).__name__} user_id={self.user.id}, reason={self.reason}>'
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'ResponseCache'
+)
+
+MISSING = object()
+
+
+def request_key(route, params=None) -> Any:
+    """Gets a hashable key identifying a request by its path and query parameters."""
+    if not params:
+        return route.path
+    return (route.path, tuple(sorted(params.items())))
+
+
+def stale_templates(route, invalidations) -> Set[str]:
+    """Gets the route templates evicted by the invalidation rules that match a request."""
+    templates = set()
+    method = f'{route.method} {route.template}'
+    for pattern, evicts in invalidations:
+        if re.fullmatch(pattern, method):
+            templates.update(evicts)
+    return templates
+
+
+def is_stale(route, path: str, template: str, templates: Set[str]) -> bool:
+    """Whether a request with a method other than GET may have made the response for a path stale.
+
+    It has when the path equals the request's path, is nested under it or contains it, or when the path's template is
+    one of the ``templates`` from :func:`stale_templates`.
+    """
+    return template in templates or path == route.path or path.startswith(route.path + '/') or route.path.startswith(path + '/')
+
+
+class ResponseCache:
+
+    """An opt-in cache for the responses of read-only GET end points.
+
+    Responses are keyed by the request's path and query parameters and are kept for the time to live configured for
+    the route's template, where IDs in the path are replaced with ``{id}``, e.g. ``/guilds/{id}/roles``. When the cache
+    is full the least recently used response is evicted. A cached response costs no round trip and no rate limit budget.
+
+    Requests with any other method invalidate the responses they may have made stale: every cached path that equals the
+    request's path, is nested under it or contains it, e.g. ``DELETE /guilds/1/emojis/2`` evicts ``/guilds/1/emojis/2``,
+    ``/guilds/1/emojis`` and ``/guilds/1``. Relations that are not visible in the path are described by the invalidation
+    rules. A response requested before such a request finished is not cached when it arrives, since it may be stale too.
+
+    Cached responses are returned as they are rather than copied, so callers must not modify them.
+
+    Parameters
+    ------------
+    max_size: :class:`int`
+        The maximum number of responses to keep.
+        Defaults to ``1024``.
+    ttls: Optional[Dict[:class:`str`, :class:`float`]]
+        The number of seconds a response is kept for, keyed by route template. Routes without a time to live are never
+        cached. Defaults to :attr:`DEFAULT_TTLS`.
+    invalidations: Optional[Iterable[Tuple[:class:`str`, Tuple[:class:`str`, ...]]]]
+        Pairs of a regular expression, matched against a request's method and route template such as
+        ``DELETE /channels/{id}``, and the route templates to evict for every ID when it matches.
+        Defaults to :attr:`DEFAULT_INVALIDATIONS`.
+
+    Attributes
+    ------------
+    hits: :class:`int`
+        The number of requests answered from the cache.
+    misses: :class:`int`
+        The number of cacheable requests that had to be sent to Discord.
+    """
+
+    DEFAULT_TTLS = {
+        '/guilds/{id}': 60.0,
+        '/guilds/{id}/preview': 60.0,
+        '/guilds/{id}/roles': 60.0,
+        '/guilds/{id}/channels': 60.0,
+        '/guilds/{id}/emojis': 300.0,
+        '/guilds/{id}/emojis/{id}': 300.0,
+        '/users/{id}': 300.0,
+        '/voice/regions': 3600.0
+    }
+
+    DEFAULT_INVALIDATIONS = (
+        (r'(PATCH|DELETE) /channels/{id}', ('/guilds/{id}/channels',)),
+        (r'POST /channels/{id}/messages/bulk-delete', ('/channels/{id}/messages/{id}',)),
+        (r'DELETE /invites/{code}', ('/channels/{id}/invites', '/guilds/{id}/invites')),
+        (r'(PATCH|DELETE) /webhooks/{id}(/{token})?', ('/webhooks/{id}', '/channels/{id}/webhooks', '/guilds/{id}/webhooks'))
+    )
+
+    __slots__ = ('max_size', 'ttls', 'invalidations', 'hits', 'misses', '__entries', '__paths', '__pending')
+
+    def __init__(self, max_size: int = 1024, ttls: Optional[Dict[str, float]] = None, invalidations: Optional[Iterable[Tuple[str, Tuple[str, ...]]]] = None) -> None:
+        self.max_size = max_size
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.invalidations = [
+            (re.compile(pattern), tuple(templates))
+            for pattern, templates in (self.DEFAULT_INVALIDATIONS if invalidations is None else invalidations)
+        ]
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__paths = {}
+        self.__pending = {}
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} size={len(self)}, hits={self.hits}, misses={self.misses}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def is_cacheable(self, route) -> bool:
+        """Whether responses for a route are cached."""
+        return route.method == 'GET' and route.template in self.ttls
+
+    def get(self, route, params=None) -> Any:
+        """Gets the cached response for a request, or ``MISSING`` if it is not cached or has expired."""
+        key = request_key(route, params)
+        entry = self.__entries.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if expires_at > time.monotonic():
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.__evict(route.path, key)
+
+        self.misses += 1
+        return MISSING
+
+    def begin(self, route) -> int:
+        """Registers a request for a cacheable route that is about to be sent. :meth:`end` must be called once it has finished.
+
+        Returns
+        ---------
+        :class:`int`
+            The generation of the request's path, to pass to :meth:`put` with the response.
+        """
+        # The path's template, its generation and the number of requests for it in flight.
+        pending = self.__pending.get(route.path)
+        if pending is None:
+            pending = self.__pending[route.path] = [route.template, 0, 0]
+        pending[2] += 1
+        return pending[1]
+
+    def end(self, route) -> None:
+        """Unregisters a request registered with :meth:`begin`."""
+        pending = self.__pending[route.path]
+        pending[2] -= 1
+        if not pending[2]:
+            del self.__pending[route.path]
+
+    def put(self, route, params, data, generation: Optional[int] = None) -> None:
+        """Caches the response for a request for the time to live configured for its route.
+
+        When the ``generation`` returned by :meth:`begin` is given, the response is only cached if nothing has
+        invalidated its path since the request was sent.
+        """
+        ttl = self.ttls.get(route.template)
+        if not ttl:
+            return
+
+        if generation is not None:
+            pending = self.__pending.get(route.path)
+            if pending is None or pending[1] != generation:
+                __log__.debug('The response for %s was invalidated while in flight and will not be cached.', route.path)
+                return
+
+        key = request_key(route, params)
+        self.__entries[key] = (time.monotonic() + ttl, data)
+        self.__entries.move_to_end(key)
+
+        path = self.__paths.get(route.path)
+        if path is None:
+            path = self.__paths[route.path] = (route.template, set())
+        path[1].add(key)
+
+        while len(self.__entries) > self.max_size:
+            key = next(iter(self.__entries))
+            self.__evict(key if isinstance(key, str) else key[0], key)
+
+    def __evict(self, path: str, key) -> None:
+        del self.__entries[key]
+
+        keys = self.__paths[path][1]
+        keys.discard(key)
+        if not keys:
+            del self.__paths[path]
+
+    def invalidate(self, route) -> int:
+        """Evicts every cached response a request may have made stale.
+
+        Returns
+        ---------
+        :class:`int`
+            The number of responses evicted.
+        """
+        templates = stale_templates(route, self.invalidations)
+
+        for path, pending in self.__pending.items():
+            if is_stale(route, path, pending[0], templates):
+                pending[1] += 1
+
+        stale = [path for path, (template, _) in self.__paths.items() if is_stale(route, path, template, templates)]
+
+        evicted = 0
+        for path in stale:
+            for key in self.__paths.pop(path)[1]:
+                del self.__entries[key]
+                evicted += 1
+
+        if evicted:
+            __log__.debug('%s %s has evicted %d cached responses.', route.method, route.path, evicted)
+
+        return evicted
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        self.__entries.clear()
+        self.__paths.clear()
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+from typing import List
+
+from restcord import utils
+
 from .permissions import PermissionOverwrite
 from .snowflake import Designation
 
@@ -9,23 +13,32 @@ __all__ = (
 
 class Channel(Designation):
 
-    """Model depicting a Discord channel object."""
+    """Model depicting a Discord channel object.
+
+    While :func:`lazy` is active the permission overwrites are built from the payload the first time they are accessed.
+    """
+
+    __slots__ = ('guild_id', 'type', 'position', 'parent_id', 'last_message_id', 'last_pin_timestamp', 'topic', 'nsfw', '_data', '_cs_permission_overwrites')
+
+    _lazy_fields = ('permission_overwrites',)
 
-    __slots__ = ('guild_id', 'type', 'position', 'permission_overwrites', 'parent_id', 'last_message_id', 'last_pin_timestamp', 'topic', 'nsfw', 'permission_overwrites')
+    def _update(self, data) -> None:
+        super()._update(data)
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        self._data = data
+        self.guild_id = utils.try_cast(data.get('guild_id'), int)
+        self.type = data.get('type')
+        self.position = data.get('position')
+        self.parent_id = utils.try_cast(data.get('parent_id'), int)
+        self.last_message_id = utils.try_cast(data.get('last_message_id'), int)
+        self.last_pin_timestamp = data.get('last_pin_timestamp')
+        self.topic = data.get('topic')
+        self.nsfw = data.get('nsfw')
 
-        self.guild_id = kwargs.get('guild_id')
-        self.type = kwargs.get('type')
-        self.position = kwargs.get('position')
-        self.permission_overwrites = kwargs.get('permission_overwrites')
-        self.parent_id = kwargs.get('parent_id')
-        self.last_message_id = kwargs.get('last_message_id')
-        self.last_pin_timestamp = kwargs.get('last_pin_timestamp')
-        self.topic = kwargs.get('topic')
-        self.nsfw = kwargs.get('nsfw')
-        self.permission_overwrites = [PermissionOverwrite(**p) for p in kwargs.get('permission_overwrites', [])]
+    @utils.cached_slot_property('_cs_permission_overwrites')
+    def permission_overwrites(self) -> List[PermissionOverwrite]:
+        """List[:class:`PermissionOverwrite`]: The channel's permission overwrites."""
+        return [PermissionOverwrite.from_dict(p) for p in self._data.get('permission_overwrites', [])]
 
     def __str__(self):
         return f'<{type(self).__name__} id={self.id}, name={self.name}, type={self.type}, position={self.position}>'
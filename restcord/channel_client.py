@@ -1,13 +1,22 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import inspect
 import logging
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, Iterable, List, Optional
 
 from aiohttp import ClientSession
 
+from restcord import utils
+
 from .channel import Channel
+from .columns import MessageTable
+from .errors import NotFound
 from .http import HTTPClient, Route
 from .invite import Invite
+from .iterators import HistoryIterator, ReactionIterator
 from .message import Message
+from .scheduler import Priority, priority
 from .user import User
 
 __log__ = logging.getLogger(__name__)
@@ -31,8 +40,8 @@ class ChannelClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_channel(self, channel_id: int) -> Channel:
         """|coro| Get a guild's channels.
@@ -56,7 +65,7 @@ class ChannelClient(HTTPClient):
 
         channel = await self._request(Route('GET', f'/channels/{channel_id}'))
 
-        return Channel(**channel)
+        return Channel.from_dict(channel)
 
     async def delete_channel(self, channel_id: int) -> None:
         """|coro| Deletes a guild channel or closes a private message.
@@ -102,7 +111,7 @@ class ChannelClient(HTTPClient):
 
         message = await self._request(Route('GET', f'/channels/{channel_id}/messages/{message_id}'))
 
-        return Message(**message)
+        return Message.from_dict(message)
 
     async def get_messages(self, channel_id: int, around=None, before=None, after=None, limit=50) -> List[Message]:
         """|coro| Get a list of a channel's messages.
@@ -133,6 +142,59 @@ class ChannelClient(HTTPClient):
         if not channel_id:
             raise ValueError("Argument cannot be None: channel_id")
 
+        messages = await self._get_messages_data(channel_id, around=around, before=before, after=after, limit=limit)
+
+        return [Message.from_dict(message) for message in messages]
+
+    async def _get_messages_data(self, channel_id: int, around=None, before=None, after=None, limit=50) -> List[dict]:
+        params = self.__get_messages_params(around, before, after, limit)
+
+        return await self._request(Route('GET', f'/channels/{channel_id}/messages'), params=params)
+
+    async def stream_messages(self, channel_id: int, around=None, before=None, after=None, limit=50) -> AsyncIterator[Message]:
+        """Get a list of a channel's messages, yielding each message as soon as it has been received.
+
+        Unlike :meth:`get_messages` the response is never held in memory as a whole, so the first message can be
+        processed before the last one has arrived. The response is not cached, and when iteration stops early the
+        iterator should be closed with ``aclose()`` to release the connection. The stream gives up its scheduler slot
+        once the response's headers have arrived, so other requests can be made while iterating.
+
+        Returns
+        ---------
+        AsyncIterator[:class:`Message`]:
+            An asynchronous iterator of Messages.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/channel#get-channel-messages
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            Discord's identifier for the channel.
+        around: Optional[:class:`int`]
+            Get messages around this message ID
+        before: Optional[:class:`int`]
+            Get messages before this message ID
+        after: Optional[:class:`int`]
+            Get messages after this message ID
+        limit: Optional[:class:`int`]
+            Max number of messages to return (1-100).
+            Defaults to 50.
+        """
+        if not channel_id:
+            raise ValueError("Argument cannot be None: channel_id")
+
+        params = self.__get_messages_params(around, before, after, limit)
+
+        messages = self._stream(Route('GET', f'/channels/{channel_id}/messages'), params=params)
+        try:
+            async for message in messages:
+                yield Message.from_dict(message)
+        finally:
+            await messages.aclose()
+
+    def __get_messages_params(self, around, before, after, limit) -> dict:
         params = {
             'limit': limit
         }
@@ -146,9 +208,86 @@ class ChannelClient(HTTPClient):
         if around is not None:
             params['around'] = around
 
-        messages = await self._request(Route('GET', f'/channels/{channel_id}/messages'), params=params)
+        return params
+
+    def iter_messages(self, channel_id: int, before=None, after=None, limit: Optional[int] = None, prefetch: bool = True) -> HistoryIterator:
+        """Iterate over a channel's messages, requesting pages of 100 messages as they are needed.
+
+        Messages are yielded newest first, unless only ``after`` is given in which case they are yielded oldest first.
+
+        Returns
+        ---------
+        :class:`HistoryIterator`:
+            An asynchronous iterator of Messages.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/channel#get-channel-messages
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            Discord's identifier for the channel.
+        before: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+            Get messages before this message ID or time
+        after: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+            Get messages after this message ID or time
+        limit: Optional[:class:`int`]
+            Max number of messages to return.
+            Defaults to ``None``, which returns every message.
+        prefetch: :class:`bool`
+            Whether to request the next page of messages while the current page is being consumed.
+            Defaults to ``True``.
+
+        Example
+        ----------
+            async for message in client.channel_client.iter_messages(channel_id, limit=1000):
+                print(message.content)
+        """
+        if not channel_id:
+            raise ValueError("Argument cannot be None: channel_id")
+
+        return HistoryIterator(self, channel_id, before=before, after=after, limit=limit, prefetch=prefetch)
+
+    async def get_message_table(self, channel_id: int, before=None, after=None, limit: Optional[int] = None) -> MessageTable:
+        """|coro| Get a channel's messages stored column by column instead of as one :class:`Message` per message.
+
+        Pages are requested like :meth:`iter_messages` but no models are built, so millions of messages can be held for
+        analysis in a fraction of the memory.
+
+        Returns
+        ---------
+        :class:`MessageTable`:
+            The table of messages.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/channel#get-channel-messages
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            Discord's identifier for the channel.
+        before: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+            Get messages before this message ID or time
+        after: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+            Get messages after this message ID or time
+        limit: Optional[:class:`int`]
+            Max number of messages to return.
+            Defaults to ``None``, which returns every message.
+        """
+        if not channel_id:
+            raise ValueError("Argument cannot be None: channel_id")
+
+        table = MessageTable()
+        messages = HistoryIterator(self, channel_id, before=before, after=after, limit=limit, raw=True)
+        try:
+            async for message in messages:
+                table.append(message)
+        finally:
+            messages.close()
 
-        return [Message(**message) for message in messages]
+        return table
 
     async def add_reaction(self, channel_id: int, message_id: int, emoji: str):
         """|coro| Add a reaction to a message.
@@ -273,6 +412,11 @@ class ChannelClient(HTTPClient):
         if not emoji:
             raise ValueError("Argument cannot be None: emoji")
 
+        users = await self._get_reactions_data(channel_id, message_id, emoji, before=before, after=after, limit=limit)
+
+        return [User.from_dict(user) for user in users]
+
+    async def _get_reactions_data(self, channel_id: int, message_id: int, emoji: str, before=None, after=None, limit=25) -> List[dict]:
         params = {
             'limit': limit
         }
@@ -283,9 +427,58 @@ class ChannelClient(HTTPClient):
         if after is not None:
             params['after'] = after
 
-        users = await self._request(Route('GET', f'/channels/{channel_id}/messages/{message_id}/reactions/{emoji}'), params=params)
+        return await self._request(Route('GET', f'/channels/{channel_id}/messages/{message_id}/reactions/{emoji}'), params=params)
+
+    def iter_reactions(self, channel_id: int, message_id: int, emoji: str, after=None, limit: Optional[int] = None, unique: bool = False,
+                       prefetch: bool = True) -> ReactionIterator:
+        """Iterate over the users who have reacted to this message with the emoji, requesting pages of 100 users as they are needed.
+
+        Use :meth:`ReactionIterator.count` or :meth:`ReactionIterator.sample` to count or draw reactors without keeping
+        every User in memory.
+
+        Returns
+        ---------
+        :class:`ReactionIterator`:
+            An asynchronous iterator of Users.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/channel#get-reactions
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            Discord's identifier for the channel.
+        message_id: :class:`int`
+            Discord's identifier for the message_id.
+        emoji: :class:`str`
+            The URL encoded emoji
+        after: Optional[:class:`int`]
+            Get reactions after this user ID
+        limit: Optional[:class:`int`]
+            Max number of users to return.
+            Defaults to ``None``, which returns every user.
+        unique: :class:`bool`
+            Whether to skip users that have already been returned.
+            Defaults to ``False``.
+        prefetch: :class:`bool`
+            Whether to request the next page of users while the current page is being consumed.
+            Defaults to ``True``.
+
+        Example
+        ----------
+            winners = await client.channel_client.iter_reactions(channel_id, message_id, emoji, unique=True).sample(3)
+        """
+        if not channel_id:
+            raise ValueError("Argument cannot be None: channel_id")
 
-        return [User(**user) for user in users]
+        if not message_id:
+            raise ValueError("Argument cannot be None: message_id")
+
+        if not emoji:
+            raise ValueError("Argument cannot be None: emoji")
+
+        return ReactionIterator(self, channel_id, message_id, emoji, after=after, limit=limit, unique=unique, prefetch=prefetch)
 
     async def delete_all_reactions(self, channel_id: int, message_id: int):
         """|coro| Deletes all reactions on a message.
@@ -387,11 +580,130 @@ class ChannelClient(HTTPClient):
         if length < 2 or length > 100:
             raise ValueError("List length must be at least 2 and no greater than 100: message_ids")
 
-        params = {
-            'messages': message_ids
+        payload = {
+            'messages': [str(message_id) for message_id in message_ids]
         }
 
-        await self._request(Route('POST', f'/channels/{channel_id}/messages/bulk-delete'), params=params)
+        await self._request(Route('POST', f'/channels/{channel_id}/messages/bulk-delete'), json=payload)
+
+    async def delete_messages(self, channel_id: int, message_ids: Iterable[int]) -> None:
+        """|coro| Deletes any number of messages from a channel using as few requests as possible.
+
+        Messages are bulk deleted in chunks of 100. Messages older than two weeks, which cannot be bulk deleted, and a
+        lone message left over from chunking are deleted individually. Messages that have already been deleted are
+        skipped. Every request waits on the rate limiter and is sent with ``Priority.BULK``.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/channel#bulk-delete-messages
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            Discord's identifier for the channel.
+        message_ids: Iterable[:class:`int`]
+            Discord's identifiers for the messages.
+        """
+        if not channel_id:
+            raise ValueError("Argument cannot be None: channel_id")
+
+        if message_ids is None:
+            raise ValueError("Argument cannot be None: message_ids")
+
+        # Leave a minute of headroom so that a message doesn't age past the limit while the request is in flight.
+        cutoff = utils.time_snowflake(datetime.now(timezone.utc) - timedelta(days=14, minutes=-1))
+
+        recent = []
+        old = []
+        for message_id in dict.fromkeys(int(message_id) for message_id in message_ids):
+            if message_id > cutoff:
+                recent.append(message_id)
+            else:
+                old.append(message_id)
+
+        with priority(Priority.BULK):
+            for i in range(0, len(recent), 100):
+                chunk = recent[i:i + 100]
+                if len(chunk) > 1:
+                    await self.bulk_delete_messages(channel_id, chunk)
+                else:
+                    old.extend(chunk)
+
+            for message_id in old:
+                try:
+                    await self.delete_message(channel_id, message_id)
+                except NotFound:
+                    __log__.debug('Message %s in channel %s has already been deleted.', message_id, channel_id)
+
+    async def purge(self, channel_id: int, check: Optional[Callable[[Message], bool]] = None, before=None, after=None, limit: Optional[int] = None) -> int:
+        """|coro| Deletes the messages in a channel's history that pass a check.
+
+        History is streamed with :meth:`iter_messages` and filtered as it arrives. Each batch of 100 matching messages is
+        deleted with :meth:`delete_messages` while the following pages are still being fetched.
+
+        Returns
+        ---------
+        :class:`int`:
+            The number of messages deleted.
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            Discord's identifier for the channel.
+        check: Optional[Callable[[:class:`Message`], :class:`bool`]]
+            A function, or coroutine function, called with each message that returns whether to delete it.
+            Defaults to ``None``, which deletes every message.
+        before: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+            Only delete messages before this message ID or time
+        after: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+            Only delete messages after this message ID or time
+        limit: Optional[:class:`int`]
+            Max number of messages to scan, whether or not they pass the check.
+            Defaults to ``None``, which scans the whole history.
+
+        Example
+        ----------
+            since = datetime.now(timezone.utc) - timedelta(days=1)
+            deleted = await client.channel_client.purge(channel_id, check=lambda m: m.author.id == user_id, after=since)
+        """
+        if not channel_id:
+            raise ValueError("Argument cannot be None: channel_id")
+
+        messages = self.iter_messages(channel_id, before=before, after=after, limit=limit)
+        deleting = None
+        batch = []
+        deleted = 0
+
+        try:
+            async for message in messages:
+                if check is not None:
+                    matched = check(message)
+                    if inspect.isawaitable(matched):
+                        matched = await matched
+                    if not matched:
+                        continue
+
+                batch.append(message.id)
+                if len(batch) == 100:
+                    if deleting is not None:
+                        await deleting
+                    deleting = asyncio.ensure_future(self.delete_messages(channel_id, batch))
+                    deleted += len(batch)
+                    batch = []
+
+            if deleting is not None:
+                await deleting
+                deleting = None
+
+            if batch:
+                await self.delete_messages(channel_id, batch)
+                deleted += len(batch)
+        finally:
+            messages.close()
+            if deleting is not None:
+                deleting.cancel()
+
+        return deleted
 
     async def get_invites(self, channel_id: int) -> List[Invite]:
         """|coro| Get a list of a channel's invites.
@@ -415,7 +727,7 @@ class ChannelClient(HTTPClient):
 
         invites = await self._request(Route('GET', f'/channels/{channel_id}/invites'))
 
-        return [Invite(**invite) for invite in invites]
+        return [Invite.from_dict(invite) for invite in invites]
 
     async def create_invite(self, channel_id: int, max_age: int = 86400, max_uses: int = 0, temporary=False, unique=False, target_user=None, target_user_type=None) -> Invite:
         """|coro| Creates a new invite object for the channel.
@@ -464,4 +776,4 @@ class ChannelClient(HTTPClient):
 
         invite = await self._request(Route('POST', f'/channels/{channel_id}/invites'), params=params)
 
-        return Invite(**invite)
+        return Invite.from_dict(invite)
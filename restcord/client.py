@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Hashable, Iterable, Mapping, Optional, Tuple, Union
 
 from aiohttp import ClientSession
 
 from .channel_client import ChannelClient
 from .emoji_client import EmojiClient
 from .guild_client import GuildClient
+from .http import ConnectionPool
 from .invite_client import InviteClient
+from .ratelimit import RateLimiter
+from .scheduler import Priority, RequestScheduler, priority
 from .user_client import UserClient
 from .voice_client import VoiceClient
 from .webhook_client import WebhookClient
@@ -28,18 +32,42 @@ class RestCord:
         Your application's token from: https://discord.com/developers/applications
     session: Optional[ClientSession]
         Optionally include your aiohttp session
+    pool: Optional[:class:`ConnectionPool`]
+        Optionally include the connection pool used when no session is given. Every client created by RestCord shares
+        one pool, so a single set of connections to Discord is kept open. Defaults to a :class:`ConnectionPool` with
+        default settings.
+    ratelimiter: Optional[:class:`RateLimiter`]
+        Optionally include the rate limit state to use. Every client created by RestCord shares the same limiter so
+        that bucket and global rate limits are enforced across all of them.
+    scheduler: Optional[:class:`RequestScheduler`]
+        Optionally include the scheduler that orders requests by :class:`Priority`. Every client created by RestCord
+        shares the same scheduler, so interactive calls go ahead of bulk traffic from any client.
+    max_retries: :class:`int`
+        How many times a request is retried after a 429, 500 or 502 response before the exception is raised.
+        Defaults to ``3``.
+    retry_jitter: :class:`float`
+        The maximum number of random seconds added to each retry delay.
+        Defaults to ``0.5``.
+    cache: Optional[:class:`ResponseCache`]
+        Optionally include a cache to answer read-only GET requests from. It is shared by every client created by RestCord.
     """
 
-    __slots__ = ('channel_client', 'emoji_client', 'guild_client', 'invite_client', 'user_client', 'voice_client', 'webhook_client')
+    __slots__ = ('pool', 'channel_client', 'emoji_client', 'guild_client', 'invite_client', 'user_client', 'voice_client', 'webhook_client')
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        self.channel_client = ChannelClient(token, loop, proxy, proxy_auth, session)
-        self.emoji_client = EmojiClient(token, loop, proxy, proxy_auth, session)
-        self.guild_client = GuildClient(token, loop, proxy, proxy_auth, session)
-        self.invite_client = InviteClient(token, loop, proxy, proxy_auth, session)
-        self.user_client = UserClient(token, loop, proxy, proxy_auth, session)
-        self.voice_client = VoiceClient(token, loop, proxy, proxy_auth, session)
-        self.webhook_client = WebhookClient(token, loop, proxy, proxy_auth, session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, pool: Optional[ConnectionPool] = None,
+                 ratelimiter: Optional[RateLimiter] = None, scheduler: Optional[RequestScheduler] = None, **kwargs) -> None:
+        self.pool = ConnectionPool() if pool is None else pool
+        kwargs['pool'] = self.pool
+        kwargs['ratelimiter'] = RateLimiter() if ratelimiter is None else ratelimiter
+        kwargs['scheduler'] = RequestScheduler() if scheduler is None else scheduler
+
+        self.channel_client = ChannelClient(token, loop, proxy, proxy_auth, session, **kwargs)
+        self.emoji_client = EmojiClient(token, loop, proxy, proxy_auth, session, **kwargs)
+        self.guild_client = GuildClient(token, loop, proxy, proxy_auth, session, **kwargs)
+        self.invite_client = InviteClient(token, loop, proxy, proxy_auth, session, **kwargs)
+        self.user_client = UserClient(token, loop, proxy, proxy_auth, session, **kwargs)
+        self.voice_client = VoiceClient(token, loop, proxy, proxy_auth, session, **kwargs)
+        self.webhook_client = WebhookClient(token, loop, proxy, proxy_auth, session, **kwargs)
 
     async def __aenter__(self):
         return self
@@ -55,3 +83,71 @@ class RestCord:
         await self.user_client.close()
         await self.voice_client.close()
         await self.webhook_client.close()
+        await self.pool.close()
+
+    async def gather(self, calls: Union[Mapping[Hashable, Any], Iterable[Tuple[Hashable, Any]]], concurrency: int = 10,
+                     level: Priority = Priority.BULK) -> AsyncIterator[Tuple[Hashable, Any, Optional[BaseException]]]:
+        """Runs many calls concurrently and yields each result as soon as it completes.
+
+        At most ``concurrency`` calls run at once and the next call is only started when one finishes, so any number of
+        calls can be given. Every request still waits on the shared rate limiter. A call that raises does not stop the
+        others; its exception is yielded in place of a result.
+
+        Returns
+        ---------
+        AsyncIterator[Tuple[Hashable, Any, Optional[:class:`BaseException`]]]
+            ``(key, result, error)`` for each call, in the order they complete. ``result`` is ``None`` when ``error`` is set.
+
+        Parameters
+        ----------
+        calls: Union[Mapping[Hashable, Callable[[], Awaitable]], Iterable[Tuple[Hashable, Callable[[], Awaitable]]]]
+            The calls to run keyed by anything hashable. Each call is a function returning an awaitable, such as a
+            ``functools.partial`` of a client method, so that it is not started until there is room for it.
+            Awaitables are accepted too.
+        concurrency: :class:`int`
+            The maximum number of calls running at once.
+            Defaults to ``10``.
+        level: :class:`Priority`
+            The priority the calls' requests are made with.
+            Defaults to ``Priority.BULK``.
+
+        Example
+        ----------
+            calls = {guild_id: partial(rc.guild_client.get_channels, guild_id) for guild_id in guild_ids}
+            async for guild_id, channels, error in rc.gather(calls, concurrency=20):
+                ...
+        """
+        if concurrency < 1:
+            raise ValueError("Argument must be at least 1: concurrency")
+
+        if isinstance(calls, Mapping):
+            calls = calls.items()
+
+        calls = iter(calls)
+        pending = {}
+
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    try:
+                        key, call = next(calls)
+                    except StopIteration:
+                        break
+                    with priority(level):
+                        pending[asyncio.ensure_future(call() if callable(call) else call)] = key
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = pending.pop(task)
+                    if task.cancelled():
+                        yield key, None, asyncio.CancelledError()
+                    elif task.exception() is not None:
+                        yield key, None, task.exception()
+                    else:
+                        yield key, task.result(), None
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+import logging
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from restcord import utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'ColumnarTable',
+    'MessageTable',
+    'MemberTable'
+)
+
+NULL = -2 ** 63
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _validity(values: array) -> Optional[bytes]:
+    """Builds an Arrow validity bitmap, least significant bit first, or ``None`` if no value is null."""
+    if NULL not in values:
+        return None
+    bitmap = bytearray((len(values) + 7) // 8)
+    for i, value in enumerate(values):
+        if value != NULL:
+            bitmap[i >> 3] |= 1 << (i & 7)
+    return bytes(bitmap)
+
+
+def _native(values: array) -> array:
+    """Gets the values in little endian byte order, as Arrow and NumPy's ``<i8`` expect."""
+    if sys.byteorder == 'little':
+        return values
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values
+
+
+class Column:
+
+    """Base class for the columns of a :class:`ColumnarTable`."""
+
+    __slots__ = ()
+
+    def append(self, value) -> None:
+        raise NotImplementedError
+
+    def get(self, index: int) -> Any:
+        raise NotImplementedError
+
+    @property
+    def nbytes(self) -> int:
+        """:class:`int`: The approximate number of bytes the column holds."""
+        raise NotImplementedError
+
+    def buffers(self) -> Dict[str, Any]:
+        """Gets the column's buffers in the Apache Arrow memory layout.
+
+        The buffers are views of the column's arrays rather than copies, so appending to the column raises
+        :exc:`BufferError` for as long as any of them is alive.
+        """
+        raise NotImplementedError
+
+    def to_numpy(self):
+        """Exports the column as a NumPy array, which may be a view of the column's arrays like :meth:`buffers`."""
+        raise NotImplementedError
+
+
+class IntColumn(Column):
+
+    """Stores integers, such as snowflakes, in an int64 array. ``None`` is stored as ``-2 ** 63``."""
+
+    __slots__ = ('values',)
+
+    def __init__(self) -> None:
+        self.values = array('q')
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: Optional[int]) -> None:
+        self.values.append(NULL if value is None else value)
+
+    def get(self, index: int) -> Optional[int]:
+        value = self.values[index]
+        return None if value == NULL else value
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+    def buffers(self) -> Dict[str, Any]:
+        return {'validity': _validity(self.values), 'data': memoryview(_native(self.values))}
+
+    def to_numpy(self):
+        return numpy.frombuffer(self.values, dtype=numpy.int64)
+
+
+class TimeColumn(IntColumn):
+
+    """Stores times as microseconds since the Unix epoch in an int64 array, read back as datetimes.
+
+    Values are appended as microseconds, see :func:`_micros`. ``None`` is stored as ``-2 ** 63``, which NumPy reads as
+    ``NaT``.
+    """
+
+    __slots__ = ()
+
+    def get(self, index: int) -> Optional[datetime]:
+        value = self.values[index]
+        return None if value == NULL else UNIX_EPOCH + timedelta(microseconds=value)
+
+    def to_numpy(self):
+        return numpy.frombuffer(self.values, dtype='datetime64[us]')
+
+
+class BoolColumn(Column):
+
+    """Stores booleans as a bitset, least significant bit first. ``None`` is stored as ``False``."""
+
+    __slots__ = ('bits', 'length')
+
+    def __init__(self) -> None:
+        self.bits = bytearray()
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def append(self, value: Optional[bool]) -> None:
+        if not self.length & 7:
+            self.bits.append(0)
+        if value:
+            self.bits[-1] |= 1 << (self.length & 7)
+        self.length += 1
+
+    def get(self, index: int) -> bool:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('column index out of range')
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def buffers(self) -> Dict[str, Any]:
+        return {'validity': None, 'data': memoryview(self.bits)}
+
+    def to_numpy(self):
+        bits = numpy.frombuffer(bytes(self.bits), dtype=numpy.uint8)
+        return numpy.unpackbits(bits, bitorder='little')[:self.length].astype(bool)
+
+
+class StringColumn(Column):
+
+    """Stores strings that repeat, such as names, once each and an int32 index into them per row.
+
+    ``None`` is stored as the index ``-1``.
+    """
+
+    __slots__ = ('indices', 'dictionary', '__lookup')
+
+    def __init__(self) -> None:
+        self.indices = array('i')
+        self.dictionary: List[str] = []
+        self.__lookup: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.indices.append(-1)
+            return
+
+        index = self.__lookup.get(value)
+        if index is None:
+            index = self.__lookup[value] = len(self.dictionary)
+            self.dictionary.append(sys.intern(value))
+        self.indices.append(index)
+
+    def get(self, index: int) -> Optional[str]:
+        value = self.indices[index]
+        return None if value == -1 else self.dictionary[value]
+
+    @property
+    def nbytes(self) -> int:
+        return self.indices.itemsize * len(self.indices) + sum(sys.getsizeof(s) for s in self.dictionary)
+
+    def buffers(self) -> Dict[str, Any]:
+        validity = None
+        if -1 in self.indices:
+            bitmap = bytearray((len(self.indices) + 7) // 8)
+            for i, value in enumerate(self.indices):
+                if value != -1:
+                    bitmap[i >> 3] |= 1 << (i & 7)
+            validity = bytes(bitmap)
+        return {'validity': validity, 'indices': memoryview(_native(self.indices)), 'dictionary': self.dictionary}
+
+    def to_numpy(self):
+        dictionary = numpy.array(self.dictionary + [None], dtype=object)
+        return dictionary[numpy.frombuffer(self.indices, dtype=numpy.int32)]
+
+
+class TextColumn(Column):
+
+    """Stores strings that rarely repeat, such as message content, as one UTF-8 buffer and int64 offsets into it."""
+
+    __slots__ = ('offsets', 'data', 'valid')
+
+    def __init__(self) -> None:
+        self.offsets = array('q', [0])
+        self.data = bytearray()
+        self.valid = BoolColumn()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, value: Optional[str]) -> None:
+        if value is not None:
+            self.data += value.encode('utf-8')
+        self.valid.append(value is not None)
+        self.offsets.append(len(self.data))
+
+    def get(self, index: int) -> Optional[str]:
+        if not self.valid.get(index):
+            return None
+        if index < 0:
+            index += len(self)
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.itemsize * len(self.offsets) + len(self.data) + self.valid.nbytes
+
+    def buffers(self) -> Dict[str, Any]:
+        validity = None
+        if not all(self.valid.get(i) for i in range(len(self))):
+            validity = bytes(self.valid.bits)
+        return {'validity': validity, 'offsets': memoryview(_native(self.offsets)), 'data': memoryview(self.data)}
+
+    def to_numpy(self):
+        return numpy.array([self.get(i) for i in range(len(self))], dtype=object)
+
+
+class IntListColumn(Column):
+
+    """Stores a list of integers per row, such as role IDs, as one int64 array and int64 offsets into it."""
+
+    __slots__ = ('offsets', 'values')
+
+    def __init__(self) -> None:
+        self.offsets = array('q', [0])
+        self.values = array('q')
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, value: Optional[Iterable[int]]) -> None:
+        if value:
+            self.values.extend(value)
+        self.offsets.append(len(self.values))
+
+    def get(self, index: int) -> List[int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('column index out of range')
+        return self.values[self.offsets[index]:self.offsets[index + 1]].tolist()
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.itemsize * (len(self.offsets) + len(self.values))
+
+    def buffers(self) -> Dict[str, Any]:
+        return {'validity': None, 'offsets': memoryview(_native(self.offsets)), 'data': memoryview(_native(self.values))}
+
+    def to_numpy(self):
+        values = numpy.frombuffer(self.values, dtype=numpy.int64)
+        offsets = numpy.frombuffer(self.offsets, dtype=numpy.int64)
+        lists = numpy.empty(len(self), dtype=object)
+        lists[:] = numpy.split(values, offsets[1:-1])
+        return lists
+
+
+class Row:
+
+    """A view of one row of a :class:`ColumnarTable`. Each column is read as an attribute when it is accessed."""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'ColumnarTable', index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            column = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(f'{type(self._table).__name__} has no column {name!r}') from None
+        return column.get(self._index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Row):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} {", ".join(f"{k}={v}" for k, v in self.as_dict().items())}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Gets every column of the row."""
+        return {name: column.get(self._index) for name, column in self._table.columns.items()}
+
+
+class ColumnarTable:
+
+    """Base class for tables that store many payloads of one kind column by column instead of as one model per row.
+
+    Snowflakes and timestamps are stored in int64 arrays, strings that repeat are stored once each, and booleans are
+    stored as bits, so a table takes a fraction of the memory of the equivalent models. Rows are read back through
+    :class:`Row` views, and whole columns can be exported to NumPy or as buffers in the Apache Arrow memory layout.
+
+    Exports share the table's memory instead of copying it, so a table is frozen once it has been exported: from then
+    on :meth:`append` and :meth:`extend` raise :exc:`BufferError`. Finish filling a table before exporting it.
+
+    Subclasses describe their columns in :attr:`COLUMNS` as ``(name, column type, getter)``, where the getter reads the
+    column's value from a payload.
+
+    Parameters
+    ------------
+    payloads: Iterable[Mapping[:class:`str`, Any]]
+        The payloads to add to the table.
+
+    Attributes
+    ------------
+    columns: Dict[:class:`str`, :class:`Column`]
+        The table's columns, by name.
+    """
+
+    COLUMNS: Tuple[Tuple[str, Callable[[], Column], Callable[[Mapping[str, Any]], Any]], ...] = ()
+
+    __slots__ = ('columns', '__appenders', '__length', '__frozen')
+
+    def __init__(self, payloads: Iterable[Mapping[str, Any]] = ()) -> None:
+        self.columns: Dict[str, Column] = {name: kind() for name, kind, _ in self.COLUMNS}
+        self.__appenders = [(self.columns[name].append, getter) for name, _, getter in self.COLUMNS]
+        self.__length = 0
+        self.__frozen = False
+        self.extend(payloads)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __getitem__(self, index: int) -> Row:
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError('table index out of range')
+        return Row(self, index)
+
+    def __iter__(self):
+        for index in range(self.__length):
+            yield Row(self, index)
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} rows={len(self)}, columns={len(self.columns)}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def append(self, data: Mapping[str, Any]) -> None:
+        """Adds a payload to the table as a row.
+
+        Raises
+        --------
+        BufferError
+            The table has been exported with :meth:`buffers` or :meth:`to_numpy`.
+        """
+        # An export holds views of the arrays, which can't be resized then, so fail before any column has grown.
+        if self.__frozen:
+            raise BufferError(f'{type(self).__name__} cannot be appended to once it has been exported.')
+        # Read every value before appending any so that a malformed payload doesn't leave the columns uneven. Getters
+        # convert values to what their column stores, so it is the getters that raise for malformed data.
+        values = [getter(data) for _, getter in self.__appenders]
+        for (append, _), value in zip(self.__appenders, values):
+            append(value)
+        self.__length += 1
+
+    def extend(self, payloads: Iterable[Mapping[str, Any]]) -> None:
+        """Adds each payload to the table as a row."""
+        for data in payloads:
+            self.append(data)
+
+    def column(self, name: str) -> List[Any]:
+        """Gets every value of a column as Python objects."""
+        column = self.columns[name]
+        return [column.get(i) for i in range(self.__length)]
+
+    @property
+    def nbytes(self) -> int:
+        """:class:`int`: The approximate number of bytes the table's columns hold."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def buffers(self) -> Dict[str, Dict[str, Any]]:
+        """Gets every column's buffers in the Apache Arrow memory layout, by column name.
+
+        Integer and time columns have a ``data`` buffer of little endian int64s, boolean columns a ``data`` bitmap,
+        repeating string columns ``indices`` into a ``dictionary`` list, and text and list columns ``offsets`` into
+        ``data``. Every column has a ``validity`` bitmap, which is ``None`` when no value is null.
+
+        The buffers are views of the table's memory, and the table is frozen from then on.
+        """
+        self.__frozen = True
+        return {name: column.buffers() for name, column in self.columns.items()}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Exports every column as a NumPy array, by column name.
+
+        Integer, time and list arrays share the table's memory, and the table is frozen from then on.
+        Requires NumPy to be installed.
+        """
+        if numpy is None:
+            raise RuntimeError('NumPy is required to export a table to NumPy arrays.')
+        self.__frozen = True
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+
+def _snowflake(value) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _micros(value: Optional[str]) -> Optional[int]:
+    """Converts an ISO 8601 timestamp to microseconds since the Unix epoch, as stored by :class:`TimeColumn`."""
+    moment = utils.parse_time(value)
+    return None if moment is None else (moment - UNIX_EPOCH) // timedelta(microseconds=1)
+
+
+class MessageTable(ColumnarTable):
+
+    """Stores messages column by column.
+
+    Columns: ``id``, ``channel_id``, ``author_id``, ``author_name``, ``type``, ``timestamp``, ``edited_timestamp``,
+    ``content``, ``pinned``, ``tts`` and ``mention_everyone``.
+
+    Example
+    ----------
+        table = await client.channel_client.get_message_table(channel_id, limit=1000000)
+        columns = table.to_numpy()
+    """
+
+    COLUMNS = (
+        ('id', IntColumn, lambda d: int(d['id'])),
+        ('channel_id', IntColumn, lambda d: _snowflake(d.get('channel_id'))),
+        ('author_id', IntColumn, lambda d: _snowflake((d.get('author') or {}).get('id'))),
+        ('author_name', StringColumn, lambda d: (d.get('author') or {}).get('username')),
+        ('type', IntColumn, lambda d: d.get('type')),
+        ('timestamp', TimeColumn, lambda d: _micros(d.get('timestamp'))),
+        ('edited_timestamp', TimeColumn, lambda d: _micros(d.get('edited_timestamp'))),
+        ('content', TextColumn, lambda d: d.get('content')),
+        ('pinned', BoolColumn, lambda d: d.get('pinned')),
+        ('tts', BoolColumn, lambda d: d.get('tts')),
+        ('mention_everyone', BoolColumn, lambda d: d.get('mention_everyone'))
+    )
+
+    __slots__ = ()
+
+
+class MemberTable(ColumnarTable):
+
+    """Stores guild members column by column.
+
+    Columns: ``id``, ``name``, ``discriminator``, ``nick``, ``roles``, ``joined_at``, ``premium_since``, ``mute`` and
+    ``deaf``.
+
+    Example
+    ----------
+        table = await client.guild_client.get_member_table(guild_id)
+        boosters = sum(1 for member in table if member.premium_since is not None)
+    """
+
+    COLUMNS = (
+        ('id', IntColumn, lambda d: int(d['user']['id'])),
+        ('name', TextColumn, lambda d: d['user'].get('username')),
+        ('discriminator', StringColumn, lambda d: d['user'].get('discriminator')),
+        ('nick', TextColumn, lambda d: d.get('nick')),
+        ('roles', IntListColumn, lambda d: [int(r) for r in d.get('roles') or ()]),
+        ('joined_at', TimeColumn, lambda d: _micros(d.get('joined_at'))),
+        ('premium_since', TimeColumn, lambda d: _micros(d.get('premium_since'))),
+        ('mute', BoolColumn, lambda d: d.get('mute')),
+        ('deaf', BoolColumn, lambda d: d.get('deaf'))
+    )
+
+    __slots__ = ()
@@ -13,18 +13,19 @@ class Emoji(Designation):
 
     __slots__ = ('roles', 'require_colons', 'managed', 'animated', 'available', 'user')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.roles = kwargs.get('roles')
-        self.require_colons = kwargs.get('require_colons')
-        self.managed = kwargs.get('managed')
-        self.animated = kwargs.get('animated')
-        self.available = kwargs.get('available')
+        roles = data.get('roles')
+        self.roles = [int(r) for r in roles] if roles is not None else None
+        self.require_colons = data.get('require_colons')
+        self.managed = data.get('managed')
+        self.animated = data.get('animated')
+        self.available = data.get('available')
 
-        user = kwargs.get('user')
+        user = data.get('user')
         if user:
-            self.user = User(**user)
+            self.user = User.from_dict(user)
         else:
             self.user = None
 
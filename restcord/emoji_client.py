@@ -27,8 +27,8 @@ class EmojiClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_emoji(self, guild_id: int, emoji_id: int) -> Emoji:
         """|coro| Get a guild emoji.
@@ -57,7 +57,7 @@ class EmojiClient(HTTPClient):
 
         emoji = await self._request(Route("GET", f'/guilds/{guild_id}/emojis/{emoji_id}'))
 
-        return Emoji(**emoji)
+        return Emoji.from_dict(emoji)
 
     async def get_emojis(self, guild_id: int) -> List[Emoji]:
         """|coro| Get a guild's emojis.
@@ -81,7 +81,7 @@ class EmojiClient(HTTPClient):
 
         emojis = await self._request(Route("GET", f'/guilds/{guild_id}/emojis'))
 
-        return [Emoji(**emojis) for emoji in emojis]
+        return [Emoji.from_dict(emoji) for emoji in emojis]
 
     async def delete_emoji(self, guild_id: int, emoji_id: int):
         """|coro| Deletes an emoji from a guild.
@@ -107,8 +107,12 @@ class RateLimited(HTTPException):
     def __init__(self, response, message):
         super().__init__(response, message)
 
-        self.retry_after = message['retry_after'] / 1000.0
-        self.is_global = message.get('global', False)
+        if isinstance(message, dict) and 'retry_after' in message:
+            self.retry_after = message['retry_after'] / 1000.0
+            self.is_global = message.get('global', False)
+        else:
+            self.retry_after = float(response.headers.get('Retry-After', 0))
+            self.is_global = response.headers.get('X-Ratelimit-Global') == 'true'
 
 
 class InternalServerError(HTTPException):
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+from typing import List, Optional
+
+from restcord import utils
+
 from .emoji import Emoji
+from .model import Model
 from .role import Role
 from .snowflake import Designation
 
@@ -13,74 +18,98 @@ __all__ = (
 
 class GuildPreview(Designation):
 
-    """Model depicting a Discord guild object."""
+    """Model depicting a Discord guild object.
+
+    While :func:`lazy` is active the emojis and welcome screen are built from the payload the first time they are
+    accessed.
+    """
 
     __slots__ = (
-        'icon', 'splash', 'discovery_splash', 'features', 'emojis', 'approximate_member_count', 'approximate_presence_count', 'description', 'welcome_screen'
+        'icon', 'splash', 'discovery_splash', 'features', 'approximate_member_count', 'approximate_presence_count', 'description',
+        '_data', '_cs_emojis', '_cs_welcome_screen'
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
-        self.icon = kwargs.get('icon')
-        self.splash = kwargs.get('splash')
-        self.discovery_splash = kwargs.get('discovery_splash')
-        self.features = kwargs.get('features')
-        self.emojis = [Emoji(**e) for e in kwargs.get('emojis', [])]
-        self.approximate_member_count = kwargs.get('approximate_member_count')
-        self.approximate_presence_count = kwargs.get('approximate_presence_count')
-        self.description = kwargs.get('description')
-
-        welcome_screen = kwargs.get('welcome_screen')
+    _lazy_fields = ('emojis', 'welcome_screen')
+
+    def _update(self, data) -> None:
+        super()._update(data)
+
+        self._data = data
+        self.icon = data.get('icon')
+        self.splash = data.get('splash')
+        self.discovery_splash = data.get('discovery_splash')
+        self.features = data.get('features')
+        self.approximate_member_count = data.get('approximate_member_count')
+        self.approximate_presence_count = data.get('approximate_presence_count')
+        self.description = data.get('description')
+
+    @utils.cached_slot_property('_cs_emojis')
+    def emojis(self) -> List[Emoji]:
+        """List[:class:`Emoji`]: The guild's custom emojis."""
+        return [Emoji.from_dict(e) for e in self._data.get('emojis', [])]
+
+    @utils.cached_slot_property('_cs_welcome_screen')
+    def welcome_screen(self) -> Optional['WelcomeScreen']:
+        """Optional[:class:`WelcomeScreen`]: The guild's welcome screen, or ``None`` if it does not have one."""
+        welcome_screen = self._data.get('welcome_screen')
         if welcome_screen:
-            self.welcome_screen = WelcomeScreen(**welcome_screen)
-        else:
-            self.welcome_screen = None
+            return WelcomeScreen.from_dict(welcome_screen)
+        return None
 
 
 class Guild(GuildPreview):
 
-    """Model depicting a Discord guild object."""
+    """Model depicting a Discord guild object.
+
+    While :func:`lazy` is active the roles, emojis and welcome screen are built from the payload the first time they are
+    accessed.
+    """
 
     __slots__ = (
         'owner_id', 'application_id', 'region', 'banner', 'afk_channel_id', 'afk_timeout',
-        'system_channel_id', 'widget_enabled', 'widget_channel_id', 'verification_level', 'roles', 'default_message_notifications',
+        'system_channel_id', 'widget_enabled', 'widget_channel_id', 'verification_level', '_cs_roles', 'default_message_notifications',
         'mfa_level', 'explicit_content_filter', 'max_presences', 'max_members', 'max_video_channel_users', 'vanity_url_code', 'premium_tier', 'premium_subscription_count',
         'system_channel_flags', 'preferred_locale', 'rules_channel_id', 'public_updates_channel_id', 'embed_enabled', 'embed_channel_id'
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
-        self.owner_id = kwargs.get('owner_id')
-        self.application_id = kwargs.get('application_id')
-        self.region = kwargs.get('region')
-        self.banner = kwargs.get('banner')
-        self.afk_channel_id = kwargs.get('afk_channel_id')
-        self.afk_timeout = kwargs.get('afk_timeout')
-        self.system_channel_id = kwargs.get('system_channel_id')
-        self.widget_enabled = kwargs.get('widget_enabled')
-        self.widget_channel_id = kwargs.get('widget_channel_id')
-        self.verification_level = kwargs.get('verification_level')
-        self.roles = [Role(**r) for r in kwargs.get('roles', [])]
-        self.default_message_notifications = kwargs.get('default_message_notifications')
-        self.mfa_level = kwargs.get('mfa_level')
-        self.explicit_content_filter = kwargs.get('explicit_content_filter')
-        self.max_presences = kwargs.get('max_presences')
-        self.max_members = kwargs.get('max_members')
-        self.max_video_channel_users = kwargs.get('max_video_channel_users')
-        self.vanity_url_code = kwargs.get('vanity_url_code')
-        self.premium_tier = kwargs.get('premium_tier')
-        self.premium_subscription_count = kwargs.get('premium_subscription_count')
-        self.system_channel_flags = kwargs.get('system_channel_flags')
-        self.preferred_locale = kwargs.get('preferred_locale')
-        self.rules_channel_id = kwargs.get('rules_channel_id')
-        self.public_updates_channel_id = kwargs.get('public_updates_channel_id')
-        self.embed_enabled = kwargs.get('embed_enabled')
-        self.embed_channel_id = kwargs.get('embed_channel_id')
-
-
-class WelcomeScreen:
+    _lazy_fields = GuildPreview._lazy_fields + ('roles',)
+
+    def _update(self, data) -> None:
+        super()._update(data)
+
+        self.owner_id = utils.try_cast(data.get('owner_id'), int)
+        self.application_id = utils.try_cast(data.get('application_id'), int)
+        self.region = data.get('region')
+        self.banner = data.get('banner')
+        self.afk_channel_id = utils.try_cast(data.get('afk_channel_id'), int)
+        self.afk_timeout = data.get('afk_timeout')
+        self.system_channel_id = utils.try_cast(data.get('system_channel_id'), int)
+        self.widget_enabled = data.get('widget_enabled')
+        self.widget_channel_id = utils.try_cast(data.get('widget_channel_id'), int)
+        self.verification_level = data.get('verification_level')
+        self.default_message_notifications = data.get('default_message_notifications')
+        self.mfa_level = data.get('mfa_level')
+        self.explicit_content_filter = data.get('explicit_content_filter')
+        self.max_presences = data.get('max_presences')
+        self.max_members = data.get('max_members')
+        self.max_video_channel_users = data.get('max_video_channel_users')
+        self.vanity_url_code = data.get('vanity_url_code')
+        self.premium_tier = data.get('premium_tier')
+        self.premium_subscription_count = data.get('premium_subscription_count')
+        self.system_channel_flags = data.get('system_channel_flags')
+        self.preferred_locale = data.get('preferred_locale')
+        self.rules_channel_id = utils.try_cast(data.get('rules_channel_id'), int)
+        self.public_updates_channel_id = utils.try_cast(data.get('public_updates_channel_id'), int)
+        self.embed_enabled = data.get('embed_enabled')
+        self.embed_channel_id = utils.try_cast(data.get('embed_channel_id'), int)
+
+    @utils.cached_slot_property('_cs_roles')
+    def roles(self) -> List[Role]:
+        """List[:class:`Role`]: The guild's roles."""
+        return [Role.from_dict(r) for r in self._data.get('roles', [])]
+
+
+class WelcomeScreen(Model):
 
     """Model depicting a Discord welcome screen object."""
 
@@ -88,18 +117,15 @@ class WelcomeScreen:
         'description', 'channels'
     )
 
-    def __init__(self, **kwargs):
-        self.description = kwargs.get('description')
-        self.channels = [WelcomeChannel(**c) for c in kwargs.get('welcome_channels', [])]
+    def _update(self, data) -> None:
+        self.description = data.get('description')
+        self.channels = [WelcomeChannel.from_dict(c) for c in data.get('welcome_channels', [])]
 
     def __str__(self) -> str:
         return f'<{type(self).__name__} description={self.description}, channels={len(self.channels)}>'
 
-    def __repr__(self) -> str:
-        return self.__str__()
 
-
-class WelcomeChannel:
+class WelcomeChannel(Model):
 
     """Model depicting a Discord welcome screen channel object."""
 
@@ -107,14 +133,11 @@ class WelcomeChannel:
         'channel_id', 'description', 'emoji_id', 'emoji_name'
     )
 
-    def __init__(self, **kwargs):
-        self.channel_id = kwargs.get('channel_id')
-        self.description = kwargs.get('description')
-        self.emoji_id = kwargs.get('emoji_id')
-        self.emoji_name = kwargs.get('emoji_name')
+    def _update(self, data) -> None:
+        self.channel_id = utils.try_cast(data.get('channel_id'), int)
+        self.description = data.get('description')
+        self.emoji_id = utils.try_cast(data.get('emoji_id'), int)
+        self.emoji_name = data.get('emoji_name')
 
     def __str__(self) -> str:
         return f'<{type(self).__name__} channel_id={self.channel_id}, description={self.description}>'
-
-    def __repr__(self) -> str:
-        return self.__str__()
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from aiohttp import ClientSession
 
 from .ban import Ban
 from .channel import Channel
+from .columns import MemberTable
 from .guild import Guild, GuildPreview
 from .http import HTTPClient, Route
+from .iterators import MemberIterator
 from .member import Member
 from .role import Role
 
@@ -31,8 +33,8 @@ class GuildClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_guild(self, guild_id: int, with_counts=False) -> Guild:
         """|coro| Get a guild.
@@ -63,7 +65,7 @@ class GuildClient(HTTPClient):
 
         guild = await self._request(Route("GET", f'/guilds/{guild_id}'), params=params)
 
-        return Guild(**guild)
+        return Guild.from_dict(guild)
 
     async def get_guild_preview(self, guild_id: int) -> GuildPreview:
         """|coro| Get a guild preview.
@@ -87,7 +89,7 @@ class GuildClient(HTTPClient):
 
         guild = await self._request(Route("GET", f'/guilds/{guild_id}/preview'))
 
-        return GuildPreview(**guild)
+        return GuildPreview.from_dict(guild)
 
     async def get_member(self, guild_id: int, member_id: int) -> Member:
         """|coro| Get a guild's member.
@@ -116,7 +118,7 @@ class GuildClient(HTTPClient):
 
         member = await self._request(Route('GET', f'/guilds/{guild_id}/members/{member_id}'))
 
-        return Member(**member)
+        return Member.from_dict(member)
 
     async def get_members(self, guild_id: int, limit: int = 1, after_id: int = 0) -> List[Member]:
         """|coro| Get a list of a guild's members.
@@ -144,14 +146,133 @@ class GuildClient(HTTPClient):
         if not guild_id:
             raise ValueError("Argument cannot be None: guild_id")
 
+        members = await self._get_members_data(guild_id, limit=limit, after_id=after_id)
+
+        return [Member.from_dict(member) for member in members]
+
+    async def _get_members_data(self, guild_id: int, limit: int = 1, after_id: int = 0) -> List[dict]:
         params = {
             'limit': limit,
             'after': after_id
         }
 
-        members = await self._request(Route('GET', f'/guilds/{guild_id}/members'), params=params)
+        return await self._request(Route('GET', f'/guilds/{guild_id}/members'), params=params)
+
+    async def stream_members(self, guild_id: int, limit: int = 1, after_id: int = 0) -> AsyncIterator[Member]:
+        """Get a list of a guild's members, yielding each member as soon as it has been received.
+
+        Unlike :meth:`get_members` the response is never held in memory as a whole, so the first member of a page of
+        1000 can be processed before the last one has arrived. The response is not cached, and when iteration stops
+        early the iterator should be closed with ``aclose()`` to release the connection. The stream gives up its
+        scheduler slot once the response's headers have arrived, so other requests can be made while iterating.
+
+        Returns
+        ---------
+        AsyncIterator[:class:`Member`]:
+            An asynchronous iterator of Members.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/guild#list-guild-members
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            Discord's identifier for the guild.
+        limit: Optional[:class:`int`]
+            Limit the amount of members returned.
+            Defaults to ``1``.
+        after_id: Optional[:class:`int`]
+            Only get members with an id greater than after_id.
+            Defaults to ``0``.
+        """
+        if not guild_id:
+            raise ValueError("Argument cannot be None: guild_id")
+
+        params = {
+            'limit': limit,
+            'after': after_id
+        }
+
+        members = self._stream(Route('GET', f'/guilds/{guild_id}/members'), params=params)
+        try:
+            async for member in members:
+                yield Member.from_dict(member)
+        finally:
+            await members.aclose()
+
+    def iter_members(self, guild_id: int, after_id=None, limit: Optional[int] = None, prefetch: bool = True) -> MemberIterator:
+        """Iterate over a guild's members, requesting pages of 1000 members as they are needed.
+
+        Members are yielded in order of their user ID and only the current page is kept in memory, so the whole guild
+        can be enumerated without building one large list.
+
+        Returns
+        ---------
+        :class:`MemberIterator`:
+            An asynchronous iterator of Members.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/guild#list-guild-members
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            Discord's identifier for the guild.
+        after_id: Optional[:class:`int`]
+            Only get members with an id greater than after_id.
+            Defaults to ``None``, which starts from the first member.
+        limit: Optional[:class:`int`]
+            Max number of members to return.
+            Defaults to ``None``, which returns every member.
+        prefetch: :class:`bool`
+            Whether to request the next page of members while the current page is being consumed.
+            Defaults to ``True``.
+        """
+        if not guild_id:
+            raise ValueError("Argument cannot be None: guild_id")
+
+        return MemberIterator(self, guild_id, after=after_id, limit=limit, prefetch=prefetch)
+
+    async def get_member_table(self, guild_id: int, after_id=None, limit: Optional[int] = None) -> MemberTable:
+        """|coro| Get a guild's members stored column by column instead of as one :class:`Member` per member.
+
+        Pages are requested like :meth:`iter_members` but no models are built, so millions of members can be held for
+        analysis in a fraction of the memory.
+
+        Returns
+        ---------
+        :class:`MemberTable`:
+            The table of members.
+
+        API Documentation
+        ----------
+            https://discord.com/developers/docs/resources/guild#list-guild-members
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            Discord's identifier for the guild.
+        after_id: Optional[:class:`int`]
+            Only get members with an id greater than after_id.
+            Defaults to ``None``, which starts from the first member.
+        limit: Optional[:class:`int`]
+            Max number of members to return.
+            Defaults to ``None``, which returns every member.
+        """
+        if not guild_id:
+            raise ValueError("Argument cannot be None: guild_id")
+
+        table = MemberTable()
+        members = MemberIterator(self, guild_id, after=after_id, limit=limit, raw=True)
+        try:
+            async for member in members:
+                table.append(member)
+        finally:
+            members.close()
 
-        return [Member(**member) for member in members]
+        return table
 
     async def get_channels(self, guild_id: int) -> List[Channel]:
         """|coro| Get a list of a guild's channels.
@@ -175,7 +296,7 @@ class GuildClient(HTTPClient):
 
         channels = await self._request(Route('GET', f'/guilds/{guild_id}/channels'))
 
-        return [Channel(**channel) for channel in channels]
+        return [Channel.from_dict(channel) for channel in channels]
 
     async def get_roles(self, guild_id: int) -> List[Role]:
         """|coro| Get a list of a guild's roles.
@@ -199,7 +320,7 @@ class GuildClient(HTTPClient):
 
         roles = await self._request(Route('GET', f'/guilds/{guild_id}/roles'))
 
-        return [Role(**role) for role in roles]
+        return [Role.from_dict(role) for role in roles]
 
     async def get_ban(self, guild_id: int, user_id: int) -> Ban:
         """|coro| Get a guild ban.
@@ -235,7 +356,7 @@ class GuildClient(HTTPClient):
 
         ban = await self._request(Route("GET", f'/guilds/{guild_id}/bans/{user_id}'))
 
-        return Ban(**ban)
+        return Ban.from_dict(ban)
 
     async def get_bans(self, guild_id: int) -> List[Ban]:
         """|coro| Get a guild's bans.
@@ -267,4 +388,4 @@ class GuildClient(HTTPClient):
 
         bans = await self._request(Route("GET", f'/guilds/{guild_id}/bans'))
 
-        return [Ban(**bans) for ban in bans]
+        return [Ban.from_dict(ban) for ban in bans]
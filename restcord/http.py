@@ -1,15 +1,16 @@
 # -*- coding: utf-8 -*-
 import asyncio
-import datetime
-import json
 import logging
+import random
+import re
 import sys
-from typing import Optional
+import time
+from typing import Any, AsyncIterator, Optional, Sequence
 
 import aiohttp
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 
-from . import __version__
+from . import __version__, utils
 from .errors import (
     BadGateway,
     BadRequest,
@@ -19,11 +20,17 @@ from .errors import (
     NotFound,
     RateLimited
 )
+from .cache import MISSING, ResponseCache, is_stale, request_key, stale_templates
+from .metrics import Hooks
+from .ratelimit import RateLimiter
+from .scheduler import RequestScheduler
+from .stream import JSONArrayDecoder
 
 __log__ = logging.getLogger(__name__)
 
 __all__ = (
     'Route',
+    'ConnectionPool',
     'HTTPClient'
 )
 
@@ -31,23 +38,121 @@ __all__ = (
 class Route:
 
     BASE = 'https://discord.com/api'
+    MAJOR_PARAMETER = re.compile(r'^/(?:channels|guilds|webhooks)/(\d+)')
+    MINOR_PARAMETER = re.compile(r'/\d+(?=/|$)')
+
+    # Parameters that are not IDs. Templates are used as metric labels, so they must not vary with, or reveal, these.
+    OPAQUE_PARAMETERS = (
+        (re.compile(r'^/webhooks/{id}/[^/]+'), '/webhooks/{id}/{token}'),
+        (re.compile(r'/reactions/[^/]+'), '/reactions/{emoji}'),
+        (re.compile(r'^/invites/[^/]+'), '/invites/{code}')
+    )
 
     def __init__(self, method, path):
         self.path = path
         self.method = method
         self.url = (self.BASE + self.path)
 
+        match = self.MAJOR_PARAMETER.match(path)
+        self.major_parameter = match.group(1) if match else None
 
-class HTTPClient:
+        self.template = self.MINOR_PARAMETER.sub('/{id}', path)
+        for pattern, replacement in self.OPAQUE_PARAMETERS:
+            self.template = pattern.sub(replacement, self.template)
+
+        self.bucket = f'{method} {self.template}:{self.major_parameter}'
+
+
+class ConnectionPool:
+
+    """Lazily creates one aiohttp ClientSession, and the TCPConnector behind it, that can be shared by several :class:`HTTPClient`.
+
+    Parameters
+    ------------
+    limit: :class:`int`
+        The maximum number of open connections. Defaults to ``100``.
+    limit_per_host: :class:`int`
+        The maximum number of open connections to the same host, or ``0`` for no limit. Defaults to ``0``.
+    keepalive_timeout: :class:`float`
+        How many seconds an idle connection is kept open for reuse. Defaults to ``15``.
+    ttl_dns_cache: Optional[:class:`int`]
+        How many seconds resolved DNS entries are cached for, or ``None`` to cache them forever. Defaults to ``10``.
+    """
+
+    __slots__ = ('limit', 'limit_per_host', 'keepalive_timeout', 'ttl_dns_cache', '__session')
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 15.0, ttl_dns_cache: Optional[int] = 10) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.__session = None
+
+    @property
+    def session(self) -> ClientSession:
+        """:class:`ClientSession`: The aiohttp ClientSession, created on first use."""
+        if self.__session is None or self.__session.closed:
+            connector = TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache
+            )
+            self.__session = ClientSession(connector=connector)
+        return self.__session
 
-    __slots__ = ('token', 'loop', 'proxy', 'proxy_auth', '__session', '__agent')
+    async def close(self):
+        if self.__session:
+            await self.__session.close()
+
+
+class HTTPClient:
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
+    """Sends requests to Discord's API, handling rate limits, retries and HTTP status codes.
+
+    Parameters
+    ------------
+    pool: Optional[:class:`ConnectionPool`]
+        The connection pool to create the session from when no ``session`` is given. A pool passed in is shared and
+        will not be closed by :meth:`close`. Defaults to a new :class:`ConnectionPool` owned by this client.
+    ratelimiter: Optional[:class:`RateLimiter`]
+        The rate limit state to use. Clients sharing a token should share a limiter so that the global rate limit is
+        enforced across all of them. Defaults to a new :class:`RateLimiter`.
+    max_retries: :class:`int`
+        How many times a request is retried after a 429, 500 or 502 response before the exception is raised.
+        Defaults to ``3``. Set to ``0`` to always raise.
+    retry_jitter: :class:`float`
+        The maximum number of random seconds added to each retry delay.
+        Defaults to ``0.5``.
+    cache: Optional[:class:`ResponseCache`]
+        The cache to answer read-only GET requests from. Defaults to ``None``, which disables caching.
+    scheduler: Optional[:class:`RequestScheduler`]
+        Decides which request is sent next, by :class:`Priority`, when too many are in flight. Clients sharing a token
+        should share a scheduler. Defaults to a new :class:`RequestScheduler`.
+    hooks: Sequence[:class:`Hooks`]
+        Objects notified of every request, response, rate limit, retry and error, such as a :class:`MetricsCollector`.
+        Defaults to none.
+    """
+
+    __slots__ = ('token', 'loop', 'proxy', 'proxy_auth', 'ratelimiter', 'max_retries', 'retry_jitter', 'cache', 'scheduler', 'hooks', '__session', '__pool', '__owns_pool', '__inflight', '__agent')
+
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, pool: Optional[ConnectionPool] = None,
+                 ratelimiter: Optional[RateLimiter] = None, max_retries: int = 3, retry_jitter: float = 0.5, cache: Optional[ResponseCache] = None,
+                 scheduler: Optional[RequestScheduler] = None, hooks: Sequence[Hooks] = ()) -> None:
         self.token = token
         self.loop = asyncio.get_event_loop() if loop is None else loop
         self.proxy = proxy
         self.proxy_auth = proxy_auth
+        self.ratelimiter = RateLimiter() if ratelimiter is None else ratelimiter
+        self.max_retries = max_retries
+        self.retry_jitter = retry_jitter
+        self.cache = cache
+        self.scheduler = RequestScheduler() if scheduler is None else scheduler
+        self.hooks = list(hooks)
         self.__session = session
+        self.__pool = ConnectionPool() if pool is None else pool
+        self.__owns_pool = pool is None
+        self.__inflight = {}
         self.__agent = f'RestCord.py (https://github.com/Yandawl/restcord.py {__version__}) Python/{sys.version_info[0]}.{sys.version_info[1]} aiohttp/{aiohttp.__version__}'
 
     async def __aenter__(self):
@@ -59,18 +164,146 @@ class HTTPClient:
     @property
     def session(self) -> ClientSession:
         """:class:`ClientSession`: The aiohttp ClientSession."""
-        if self.__session is None or self.__session.closed:
-            self.__session = ClientSession()
+        if self.__session is None:
+            return self.__pool.session
         return self.__session
 
     async def close(self):
         if self.__session:
             await self.__session.close()
 
+        if self.__owns_pool:
+            await self.__pool.close()
+
+    def _emit(self, event: str, *args) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(*args)
+            except Exception:
+                __log__.exception('%r has raised an exception in %s.', hook, event)
+
     async def _request(self, route: Route, **kwargs):
-        method = route.method
-        url = route.url
+        """|coro| Sends a request, retrying it as configured, and returns the decoded response.
+
+        The decoded response of a GET is shared with every identical request in flight and, when it is cached, with
+        every later request answered from the cache. It must be treated as read-only; copy it before modifying it.
+        """
+        if route.method != 'GET':
+            try:
+                return await self.__request(route, **kwargs)
+            finally:
+                self.__invalidate(route)
+
+        # Identical GETs already in flight share one request, and its result or exception, instead of sending another.
+        params = kwargs.get('params')
+        key = request_key(route, params)
+        inflight = self.__inflight.get(key)
+        if inflight is None:
+            cacheable = self.cache is not None and self.cache.is_cacheable(route)
+            if cacheable:
+                data = self.cache.get(route, params)
+                if data is not MISSING:
+                    return data
+
+            future = asyncio.ensure_future(self.__fetch(route, cacheable, **kwargs))
+            inflight = self.__inflight[key] = (route, future)
+            future.add_done_callback(lambda f: self.__landed(key, f))
+
+        return await asyncio.shield(inflight[1])
+
+    def __invalidate(self, route: Route) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(route)
+            invalidations = self.cache.invalidations
+        else:
+            invalidations = ResponseCache.DEFAULT_INVALIDATIONS
 
+        # GETs sent before the request finished may return stale data, so later GETs must not join them.
+        templates = stale_templates(route, invalidations)
+        stale = [key for key, (inflight, _) in self.__inflight.items() if is_stale(route, inflight.path, inflight.template, templates)]
+        for key in stale:
+            del self.__inflight[key]
+
+    def __landed(self, key, future) -> None:
+        inflight = self.__inflight.get(key)
+        if inflight is not None and inflight[1] is future:
+            del self.__inflight[key]
+
+        # Every caller waiting for the request may have been cancelled, so don't report its exception as unhandled.
+        if not future.cancelled():
+            future.exception()
+
+    async def __fetch(self, route: Route, cacheable: bool, **kwargs):
+        if not cacheable:
+            return await self.__request(route, **kwargs)
+
+        generation = self.cache.begin(route)
+        try:
+            data = await self.__request(route, **kwargs)
+            self.cache.put(route, kwargs.get('params'), data, generation)
+            return data
+        finally:
+            self.cache.end(route)
+
+    async def __request(self, route: Route, **kwargs):
+        self.__prepare(kwargs)
+
+        attempt = 0
+        while True:
+            try:
+                return await self.__send(route, **kwargs)
+            except Exception as e:
+                await self.__backoff(route, attempt, e)
+            attempt += 1
+
+    async def _stream(self, route: Route, **kwargs) -> AsyncIterator[Any]:
+        """Yields the elements of a JSON array response as soon as each one has been received, instead of reading and
+        decoding the whole body first.
+
+        The request is retried like :meth:`_request` until a successful response starts to arrive, but is never
+        answered from the cache or shared with identical requests in flight.
+
+        The request's scheduler slot is released as soon as the headers have arrived, so a stream doesn't count
+        towards ``max_in_flight`` while its body is consumed and requests made while iterating are not held up by it.
+        The response's connection is held until the stream has been consumed or closed.
+        """
+        self.__prepare(kwargs)
+
+        attempt = 0
+        while True:
+            try:
+                r, bucket, sent, waited = await self.__open(route, **kwargs)
+                if 300 > r.status >= 200 and r.content_type == 'application/json':
+                    # The caller may make requests of its own between elements, which would wait forever for the slot.
+                    self.scheduler.release()
+                    break
+
+                data = await self.__receive(route, r, sent, waited, kwargs)
+                self.__raise_for_status(route, bucket, r, data)
+
+                # A successful response that is not JSON has no elements.
+                return
+            except Exception as e:
+                await self.__backoff(route, attempt, e)
+            attempt += 1
+
+        decoder = JSONArrayDecoder()
+        received = 0
+        try:
+            async for chunk in r.content.iter_any():
+                received += len(chunk)
+                for element in decoder.feed(chunk):
+                    yield element
+            decoder.close()
+        except Exception as e:
+            self._emit('on_error', route, e)
+            raise
+        finally:
+            r.release()
+            if self.hooks:
+                self.__emit_response(route, r, sent, waited, received, kwargs)
+
+    def __prepare(self, kwargs: dict) -> None:
         kwargs['headers'] = {
             'User-Agent': self.__agent,
             'X-Ratelimit-Precision': 'millisecond',
@@ -79,7 +312,7 @@ class HTTPClient:
 
         if 'json' in kwargs:
             kwargs['headers']['Content-Type'] = 'application/json'
-            kwargs['data'] = self.__to_json(kwargs.pop('json'))
+            kwargs['data'] = utils.to_json(kwargs.pop('json'))
 
         if self.proxy is not None:
             kwargs['proxy'] = self.proxy
@@ -87,58 +320,117 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs['proxy_auth'] = self.proxy_auth
 
-        async with self.session.request(method, url, **kwargs) as r:
-            __log__.debug(f'{method} {url} with {kwargs.get("data")} has returned {r.status}')
+    async def __backoff(self, route: Route, attempt: int, error: Exception) -> None:
+        if isinstance(error, RateLimited):
+            delay = error.retry_after
+        elif isinstance(error, (InternalServerError, BadGateway)):
+            delay = 2 ** attempt
+        else:
+            self._emit('on_error', route, error)
+            raise error
 
-            data = await self.__get_data(r)
+        if attempt >= self.max_retries:
+            self._emit('on_error', route, error)
+            raise error
 
-            remaining = r.headers.get('X-Ratelimit-Remaining')
-            if remaining == '0' and r.status != 429:
-                __log__.debug(f'A rate limit bucket has been exhausted (retry: {self.__parse_ratelimit_header(r)}).')
+        attempt += 1
+        delay += random.uniform(0, self.retry_jitter)
+        __log__.debug('%s %s will be retried in %.2f seconds (attempt %d of %d).', route.method, route.url, delay, attempt, self.max_retries)
+        self._emit('on_retry', route, attempt, delay, error)
+        await asyncio.sleep(delay)
 
-            if 300 > r.status >= 200:
-                __log__.debug(f'{method} {url} has received {data}')
-                return data
+    async def __send(self, route: Route, **kwargs):
+        r, bucket, sent, waited = await self.__open(route, **kwargs)
+        data = await self.__receive(route, r, sent, waited, kwargs)
+        self.__raise_for_status(route, bucket, r, data)
 
-            if r.status == 429:
-                raise RateLimited(r, data)
+        __log__.debug('%s %s has received %s', route.method, route.url, data)
+        return data
 
-            if r.status == 400:
-                raise BadRequest(r, data)
+    async def __open(self, route: Route, **kwargs):
+        # Returns once the headers of the response have arrived. The caller must release the response and the scheduler.
+        method = route.method
+        url = route.url
+
+        if self.hooks:
+            self._emit('on_request_start', route)
 
-            if r.status == 403:
-                raise Forbidden(r, data)
+        reserved = bucket = self.ratelimiter.get_bucket(route)
+        waited = await reserved.acquire()
 
-            if r.status == 404:
-                raise NotFound(r, data)
+        admitted = False
+        try:
+            waited += await self.scheduler.acquire()
+            admitted = True
+
+            waited += await self.ratelimiter.acquire_global()
 
-            if r.status == 500:
-                raise InternalServerError(r, data)
+            sent = time.perf_counter()
+            r = await self.session.request(method, url, **kwargs)
+            __log__.debug('%s %s with %s has returned %s', method, url, kwargs.get('data'), r.status)
 
-            if r.status == 502:
-                raise BadGateway(r, data)
+            bucket = self.ratelimiter.update(route, bucket, r.headers)
+            if bucket.remaining == 0 and r.status != 429:
+                __log__.debug('A rate limit bucket has been exhausted (bucket: %s).', bucket.key)
+        except BaseException:
+            if admitted:
+                self.scheduler.release()
+            raise
+        finally:
+            reserved.release()
 
-            raise HTTPException(r, data)
+        return r, bucket, sent, waited
 
-    async def __get_data(self, response):
-        text = await response.text(encoding='utf-8')
+    async def __receive(self, route: Route, r, sent: float, waited: float, kwargs: dict):
         try:
-            if response.headers['content-type'] == 'application/json':
-                return json.loads(text)
-        except KeyError:
-            pass
-
-        return text
-
-    def __parse_ratelimit_header(self, request, *, use_clock=False):
-        reset_after = request.headers.get('X-Ratelimit-Reset-After')
-        if use_clock or not reset_after:
-            utc = datetime.timezone.utc
-            now = datetime.datetime.now(utc)
-            reset = datetime.datetime.fromtimestamp(float(request.headers['X-Ratelimit-Reset']), utc)
-            return (reset - now).total_seconds()
-        else:
-            return float(reset_after)
+            body = await r.read()
+        finally:
+            r.release()
+            self.scheduler.release()
+
+        if self.hooks:
+            self.__emit_response(route, r, sent, waited, len(body), kwargs)
+
+        return self.__get_data(r, body)
+
+    def __emit_response(self, route: Route, r, sent: float, waited: float, received: int, kwargs: dict) -> None:
+        sent_data = kwargs.get('data')
+        self._emit('on_response', route, r.status, time.perf_counter() - sent, waited, received,
+                   len(sent_data) if isinstance(sent_data, (bytes, str)) else 0)
+
+    def __raise_for_status(self, route: Route, bucket, r, data) -> None:
+        if 300 > r.status >= 200:
+            return
+
+        if r.status == 429:
+            ratelimited = RateLimited(r, data)
+            if ratelimited.is_global:
+                self.ratelimiter.set_global(ratelimited.retry_after)
+            else:
+                bucket.exhaust(ratelimited.retry_after)
+            if self.hooks:
+                self._emit('on_ratelimit', route, bucket.key, ratelimited.retry_after, ratelimited.is_global)
+            raise ratelimited
+
+        if r.status == 400:
+            raise BadRequest(r, data)
+
+        if r.status == 403:
+            raise Forbidden(r, data)
+
+        if r.status == 404:
+            raise NotFound(r, data)
+
+        if r.status == 500:
+            raise InternalServerError(r, data)
+
+        if r.status == 502:
+            raise BadGateway(r, data)
+
+        raise HTTPException(r, data)
+
+    def __get_data(self, response, body: bytes):
+        if response.content_type == 'application/json':
+            return utils.from_json(body)
 
-    def __to_json(self, obj):
-        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+        return body.decode('utf-8')
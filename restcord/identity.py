@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import logging
+import weakref
+from contextvars import ContextVar
+from typing import Any, List, Optional
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'IdentityMap'
+)
+
+_active = ContextVar('restcord_identity_map', default=None)
+
+
+def current() -> Optional['IdentityMap']:
+    """Gets the :class:`IdentityMap` active in the current context, if any."""
+    return _active.get()
+
+
+class IdentityMap:
+
+    """Reuses one model instance per type and ID while it is active.
+
+    When a model is built from a payload whose type and ID are already in the map, the existing instance is updated
+    with the new payload and returned instead of allocating a new one. Only instances that are still referenced
+    elsewhere are kept, so the map never keeps models alive by itself.
+
+    Models whose ID does not identify them on its own, :class:`Member` and :class:`PermissionOverwrite`, are never
+    interned. The map is active inside its context manager, and in any task started from inside it. Nested models built
+    lazily while :func:`lazy` is active, such as :attr:`Message.author`, are only interned if they are first accessed
+    while the map is active.
+
+    Example
+    ----------
+        with IdentityMap():
+            messages = await client.channel_client.iter_messages(channel_id, limit=100000).flatten()
+            authors = {message.author for message in messages}
+    """
+
+    __slots__ = ('__instances', '__tokens')
+
+    def __init__(self) -> None:
+        self.__instances = weakref.WeakValueDictionary()
+        self.__tokens: List[Any] = []
+
+    def __enter__(self):
+        self.__tokens.append(_active.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _active.reset(self.__tokens.pop())
+
+    def __len__(self) -> int:
+        return len(self.__instances)
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} size={len(self)}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def get(self, cls: type, id: int) -> Optional[Any]:
+        """Gets the instance of a model type with an ID, or ``None`` if there is none."""
+        return self.__instances.get((cls, id))
+
+    def add(self, cls: type, id: int, instance: Any) -> None:
+        """Adds an instance of a model type with an ID to the map."""
+        self.__instances[(cls, id)] = instance
+
+    def clear(self) -> None:
+        """Removes every instance from the map."""
+        self.__instances.clear()
@@ -1,36 +1,34 @@
 # -*- coding: utf-8 -*-
-from .user import User
 from .guild import GuildPreview
+from .model import Model
+from .user import User
 
 __all__ = (
     'Invite'
 )
 
 
-class Invite:
+class Invite(Model):
 
     """Model depicting a Discord invite object."""
 
     __slots__ = ('code', 'guild', 'channel', 'inviter', 'target_user', 'target_user_type', 'approximate_presence_count', 'approximate_member_count')
 
-    def __init__(self, **kwargs):
-        self.code = kwargs.get('code')
-        self.guild = GuildPreview(**kwargs.get('guild'))
-        self.channel = kwargs.get('channel')
+    def _update(self, data) -> None:
+        self.code = data.get('code')
+        self.guild = GuildPreview.from_dict(data.get('guild'))
+        self.channel = data.get('channel')
 
-        inviter = kwargs.get('inviter')
+        inviter = data.get('inviter')
         if inviter:
-            self.inviter = User(**inviter)
+            self.inviter = User.from_dict(inviter)
         else:
             self.inviter = None
 
-        self.target_user = kwargs.get('target_user')
-        self.target_user_type = kwargs.get('target_user_type')
-        self.approximate_presence_count = kwargs.get('approximate_presence_count')
-        self.approximate_member_count = kwargs.get('approximate_member_count')
+        self.target_user = data.get('target_user')
+        self.target_user_type = data.get('target_user_type')
+        self.approximate_presence_count = data.get('approximate_presence_count')
+        self.approximate_member_count = data.get('approximate_member_count')
 
     def __str__(self) -> str:
         return f'<{type(self).__name__} code={self.code}>'
-
-    def __repr__(self) -> str:
-        return self.__str__()
@@ -27,8 +27,8 @@ class InviteClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_invite(self, invite_code: str, with_counts=False) -> Invite:
         """|coro| Gets an invite.
@@ -59,7 +59,7 @@ class InviteClient(HTTPClient):
 
         invite = await self._request(Route('GET', f'/invites/{invite_code}'), params=params)
 
-        return Invite(**invite)
+        return Invite.from_dict(invite)
 
     async def delete_invite(self, invite_code: str) -> Invite:
         """|coro| Deletes an invite.
@@ -83,4 +83,4 @@ class InviteClient(HTTPClient):
 
         invite = await self._request(Route('DELETE', f'/invites/{invite_code}'))
 
-        return Invite(**invite)
+        return Invite.from_dict(invite)
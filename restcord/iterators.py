@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import random
+from collections import deque
+from datetime import datetime
+from typing import Any, List, Optional
+
+from restcord import utils
+
+from .member import Member
+from .message import Message
+from .scheduler import Priority, priority
+from .user import User
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'PageIterator',
+    'HistoryIterator',
+    'MemberIterator',
+    'ReactionIterator'
+)
+
+
+class PageIterator:
+
+    """Base class for asynchronous iterators that page through one of Discord's list end points.
+
+    Items are yielded one at a time. While the current page is being consumed the next page can be requested in the
+    background, so that the caller's processing overlaps with the round trip.
+
+    Parameters
+    ------------
+    limit: Optional[:class:`int`]
+        The maximum number of items to yield, or ``None`` for every item.
+    page_size: :class:`int`
+        The maximum number of items Discord returns per request.
+    prefetch: :class:`bool`
+        Whether to request the next page while the current page is consumed.
+    raw: :class:`bool`
+        Whether to yield the decoded payloads instead of building a model from each.
+
+    Attributes
+    ------------
+    level: :class:`Priority`
+        The priority pages are requested with. Defaults to ``Priority.BULK``.
+    """
+
+    def __init__(self, limit: Optional[int], page_size: int, prefetch: bool = True, raw: bool = False) -> None:
+        self.__items = deque()
+        self.__next_page = None
+
+        if limit is not None and limit < 0:
+            raise ValueError("Argument must be a positive integer or None: limit")
+
+        self.remaining = limit
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.raw = raw
+        self.level = Priority.BULK
+        self._exhausted = limit == 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        await self.__fill()
+
+        if not self.__items:
+            raise StopAsyncIteration
+
+        return self.__items.popleft()
+
+    async def _get_page(self, size: int) -> List[Any]:
+        """|coro| Requests the page of payloads after the current cursor and moves the cursor past it.
+
+        Implementations set ``_exhausted`` when no further page should be requested. A page with fewer than ``size``
+        items ends the iteration automatically.
+        """
+        raise NotImplementedError
+
+    def _filter(self, page: List[Any]) -> List[Any]:
+        """Removes payloads that should not be yielded from a page, after its length has been used to detect the last page."""
+        return page
+
+    def _build(self, data: Any) -> Any:
+        """Builds the item to yield from a payload when the iterator is not raw."""
+        return data
+
+    async def __load(self) -> List[Any]:
+        size = self.page_size if self.remaining is None else min(self.remaining, self.page_size)
+        with priority(self.level):
+            page = await self._get_page(size)
+        if len(page) < size:
+            self._exhausted = True
+        page = self._filter(page)
+        if self.raw:
+            return page
+        return [self._build(data) for data in page]
+
+    async def __fill(self) -> None:
+        # Every item of a page may have been filtered out, so keep loading pages until one has items or none are left.
+        while not self.__items:
+            if self.__next_page is None:
+                if self._exhausted:
+                    return
+                self.__next_page = asyncio.ensure_future(self.__load())
+
+            try:
+                page = await self.__next_page
+            finally:
+                self.__next_page = None
+
+            if self.remaining is not None:
+                page = page[:self.remaining]
+                self.remaining -= len(page)
+                if not self.remaining:
+                    self._exhausted = True
+
+            self.__items.extend(page)
+
+            if self.prefetch and not self._exhausted:
+                self.__next_page = asyncio.ensure_future(self.__load())
+                # The page may never be awaited if the caller stops iterating, so don't report its exception as unhandled.
+                self.__next_page.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def close(self) -> None:
+        """Cancels the request for the next page if one is in flight.
+
+        Call this when you stop iterating early while the client is being closed.
+        """
+        if self.__next_page is not None and not self.__next_page.done():
+            self.__next_page.cancel()
+        self.__next_page = None
+
+    async def flatten(self) -> List[Any]:
+        """|coro| Consumes the iterator into a list."""
+        return [item async for item in self]
+
+    async def count(self) -> int:
+        """|coro| Consumes the iterator and counts the items without keeping them."""
+        count = 0
+        async for _ in self:
+            count += 1
+        return count
+
+    async def sample(self, k: int, rng: Optional[random.Random] = None) -> List[Any]:
+        """|coro| Consumes the iterator and picks ``k`` items uniformly at random, keeping only ``k`` items in memory.
+
+        Parameters
+        ------------
+        k: :class:`int`
+            The number of items to pick. Fewer are returned if the iterator yields fewer items.
+        rng: Optional[:class:`random.Random`]
+            The random number generator to use, e.g. a seeded one for a reproducible draw.
+        """
+        if k < 0:
+            raise ValueError("Argument must be a positive integer: k")
+
+        rng = random if rng is None else rng
+        reservoir = []
+        seen = 0
+        async for item in self:
+            seen += 1
+            if len(reservoir) < k:
+                reservoir.append(item)
+            else:
+                index = rng.randrange(seen)
+                if index < k:
+                    reservoir[index] = item
+        return reservoir
+
+
+class HistoryIterator(PageIterator):
+
+    """Iterates over a channel's messages.
+
+    Messages are yielded newest first, unless only ``after`` is given in which case they are yielded oldest first.
+
+    Parameters
+    ------------
+    client: :class:`ChannelClient`
+        The client used to request each page of messages.
+    channel_id: :class:`int`
+        Discord's identifier for the channel.
+    before: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+        Only yield messages before this message ID or time.
+    after: Optional[Union[:class:`int`, :class:`datetime.datetime`]]
+        Only yield messages after this message ID or time.
+    limit: Optional[:class:`int`]
+        The maximum number of messages to yield, or ``None`` for every message.
+    prefetch: :class:`bool`
+        Whether to request the next page while the current page is consumed.
+    raw: :class:`bool`
+        Whether to yield message payloads instead of :class:`Message` models.
+    """
+
+    def __init__(self, client, channel_id: int, before=None, after=None, limit: Optional[int] = None, prefetch: bool = True, raw: bool = False) -> None:
+        super().__init__(limit, 100, prefetch, raw)
+
+        if isinstance(before, datetime):
+            before = utils.time_snowflake(before, high=False)
+
+        if isinstance(after, datetime):
+            after = utils.time_snowflake(after, high=True)
+
+        self.client = client
+        self.channel_id = channel_id
+        self.before = before
+        self.after = after
+        self.oldest_first = after is not None and before is None
+
+    async def _get_page(self, size: int) -> List[Any]:
+        if self.oldest_first:
+            messages = await self.client._get_messages_data(self.channel_id, after=self.after, limit=size)
+            # The page may be shared with identical requests and the cache, so reverse a copy.
+            messages = messages[::-1]
+            if messages:
+                self.after = int(messages[-1]['id'])
+            return messages
+
+        messages = await self.client._get_messages_data(self.channel_id, before=self.before, limit=size)
+        if messages:
+            self.before = int(messages[-1]['id'])
+
+        if self.after is not None:
+            after = int(self.after)
+            newer = [m for m in messages if int(m['id']) > after]
+            if len(newer) < len(messages):
+                self._exhausted = True
+            messages = newer
+
+        return messages
+
+    def _build(self, data: Any) -> Message:
+        return Message.from_dict(data)
+
+
+class MemberIterator(PageIterator):
+
+    """Iterates over a guild's members in order of their user ID.
+
+    Only one page of members, plus the prefetched page, is held in memory at a time however large the guild is.
+
+    Parameters
+    ------------
+    client: :class:`GuildClient`
+        The client used to request each page of members.
+    guild_id: :class:`int`
+        Discord's identifier for the guild.
+    after: Optional[:class:`int`]
+        Only yield members with a user ID greater than this.
+    limit: Optional[:class:`int`]
+        The maximum number of members to yield, or ``None`` for every member.
+    prefetch: :class:`bool`
+        Whether to request the next page while the current page is consumed.
+    raw: :class:`bool`
+        Whether to yield member payloads instead of :class:`Member` models.
+    """
+
+    def __init__(self, client, guild_id: int, after=None, limit: Optional[int] = None, prefetch: bool = True, raw: bool = False) -> None:
+        super().__init__(limit, 1000, prefetch, raw)
+
+        self.client = client
+        self.guild_id = guild_id
+        self.after = 0 if after is None else after
+
+    async def _get_page(self, size: int) -> List[Any]:
+        members = await self.client._get_members_data(self.guild_id, limit=size, after_id=self.after)
+        if members:
+            self.after = int(members[-1]['user']['id'])
+        return members
+
+    def _build(self, data: Any) -> Member:
+        return Member.from_dict(data)
+
+
+class ReactionIterator(PageIterator):
+
+    """Iterates over the users who reacted to a message with an emoji, in order of their user ID.
+
+    Parameters
+    ------------
+    client: :class:`ChannelClient`
+        The client used to request each page of users.
+    channel_id: :class:`int`
+        Discord's identifier for the channel.
+    message_id: :class:`int`
+        Discord's identifier for the message.
+    emoji: :class:`str`
+        The URL encoded emoji.
+    after: Optional[:class:`int`]
+        Only yield users with an ID greater than this.
+    limit: Optional[:class:`int`]
+        The maximum number of users to yield, or ``None`` for every user.
+    unique: :class:`bool`
+        Whether to skip users that have already been yielded. Only their IDs are remembered.
+    prefetch: :class:`bool`
+        Whether to request the next page while the current page is consumed.
+    raw: :class:`bool`
+        Whether to yield user payloads instead of :class:`User` models.
+    """
+
+    def __init__(self, client, channel_id: int, message_id: int, emoji: str, after=None, limit: Optional[int] = None, unique: bool = False,
+                 prefetch: bool = True, raw: bool = False) -> None:
+        super().__init__(limit, 100, prefetch, raw)
+
+        self.client = client
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.emoji = emoji
+        self.after = after
+        self.seen = set() if unique else None
+
+    async def _get_page(self, size: int) -> List[Any]:
+        users = await self.client._get_reactions_data(self.channel_id, self.message_id, self.emoji, after=self.after, limit=size)
+        if users:
+            self.after = int(users[-1]['id'])
+
+        return users
+
+    def _filter(self, page: List[Any]) -> List[Any]:
+        if self.seen is None:
+            return page
+
+        unique = []
+        for user in page:
+            user_id = int(user['id'])
+            if user_id not in self.seen:
+                self.seen.add(user_id)
+                unique.append(user)
+        return unique
+
+    def _build(self, data: Any) -> User:
+        return User.from_dict(data)
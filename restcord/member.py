@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from typing import Optional
+
 from restcord import utils
 
 from .user import User
@@ -13,22 +15,39 @@ class Member(User):
     """
     Model depicting a Discord member object.
     A member is an extention of :class:`User` where user is a member of a guild.
+    While :func:`lazy` is active the timestamps are parsed from the payload the first time they are accessed.
     """
 
-    __slots__ = ('nick', 'premium_since', 'mute', 'deaf', 'joined_at')
+    __slots__ = ('nick', 'mute', 'deaf', '_data', '_cs_premium_since', '_cs_joined_at')
+
+    _lazy_fields = ('premium_since', 'joined_at')
+
+    @classmethod
+    def _identity(cls, data) -> Optional[int]:
+        # A user is a different member in every guild and the payload has no guild ID, so members are never interned.
+        return None
 
-    def __init__(self, **kwargs):
-        user = kwargs.get('user')
+    def _update(self, data) -> None:
+        user = data.get('user')
 
-        self.id = user.get('id')
+        self._data = data
+        self.id = utils.try_cast(user.get('id'), int)
         self.name = user.get('username')
         self.discriminator = user.get('discriminator')
         self.avatar = user.get('avatar')
-        self.nick = kwargs.get('nick')
-        self.premium_since = utils.parse_time(kwargs.get('premium_since'))
-        self.mute = kwargs.get('mute')
-        self.deaf = kwargs.get('deaf')
-        self.joined_at = utils.parse_time(kwargs.get('joined_at'))
+        self.nick = data.get('nick')
+        self.mute = data.get('mute')
+        self.deaf = data.get('deaf')
+
+    @utils.cached_slot_property('_cs_premium_since')
+    def premium_since(self):
+        """Optional[:class:`datetime.datetime`]: When the member started boosting the guild, or ``None`` if they are not."""
+        return utils.parse_time(self._data.get('premium_since'))
+
+    @utils.cached_slot_property('_cs_joined_at')
+    def joined_at(self):
+        """Optional[:class:`datetime.datetime`]: When the member joined the guild."""
+        return utils.parse_time(self._data.get('joined_at'))
 
     def __str__(self):
         return f'<{type(self).__name__} id={self.id}, name={self.name}, discriminator={self.discriminator}, nick={self.nick}, joined_at={self.joined_at}>'
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from restcord import utils
 
+from typing import Optional
+
 from .snowflake import Snowflake
 from .user import User
 
@@ -11,34 +13,43 @@ __all__ = (
 
 class Message(Snowflake):
 
-    """Model depicting a Discord message object."""
-
-    __slots__ = ('channel_id', 'type', 'content', 'author', 'pinned', 'tts', 'mention_everyone', 'timestamp', 'edited_timestamp')
+    """Model depicting a Discord message object.
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    While :func:`lazy` is active the author and timestamps are built from the payload the first time they are accessed.
+    """
 
-        self.channel_id = kwargs.get('channel_id')
-        self.type = kwargs.get('type')
-        self.content = kwargs.get('content')
+    __slots__ = ('channel_id', 'type', 'content', 'pinned', 'tts', 'mention_everyone', '_data', '_cs_author', '_cs_timestamp', '_cs_edited_timestamp')
 
-        author = kwargs.get('author')
-        if author:
-            self.author = User(**author)
-        else:
-            self.author = None
+    _lazy_fields = ('author', 'timestamp', 'edited_timestamp')
 
-        self.pinned = kwargs.get('pinned')
-        self.tts = kwargs.get('tts')
-        self.mention_everyone = kwargs.get('mention_everyone')
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.timestamp = utils.parse_time(kwargs.get('timestamp'))
+        self._data = data
+        self.channel_id = utils.try_cast(data.get('channel_id'), int)
+        self.type = data.get('type')
+        self.content = data.get('content')
+        self.pinned = data.get('pinned')
+        self.tts = data.get('tts')
+        self.mention_everyone = data.get('mention_everyone')
 
-        edited_timestamp = kwargs.get('edited_timestamp')
-        if edited_timestamp:
-            self.edited_timestamp = utils.parse_time(edited_timestamp)
-        else:
-            self.edited_timestamp = None
+    @utils.cached_slot_property('_cs_author')
+    def author(self) -> Optional[User]:
+        """Optional[:class:`User`]: The author of the message."""
+        author = self._data.get('author')
+        if author:
+            return User.from_dict(author)
+        return None
+
+    @utils.cached_slot_property('_cs_timestamp')
+    def timestamp(self):
+        """Optional[:class:`datetime.datetime`]: When the message was sent."""
+        return utils.parse_time(self._data.get('timestamp'))
+
+    @utils.cached_slot_property('_cs_edited_timestamp')
+    def edited_timestamp(self):
+        """Optional[:class:`datetime.datetime`]: When the message was last edited, or ``None`` if it has not been."""
+        return utils.parse_time(self._data.get('edited_timestamp'))
 
     def __str__(self) -> str:
         return f'<{type(self).__name__} id={self.id}, channel_id={self.channel_id}, timestamp={self.timestamp}>'
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+import bisect
+import logging
+from collections import defaultdict
+from typing import Dict, Sequence, Tuple
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'Hooks',
+    'MetricsCollector'
+)
+
+
+class Hooks:
+
+    """Base class for objects that observe the requests made by an :class:`HTTPClient`.
+
+    Override the methods you are interested in and pass an instance to the client with ``hooks=[...]``. Hooks are
+    called synchronously from the request path, so they should return quickly. An exception raised by a hook is logged
+    and does not affect the request.
+    """
+
+    def on_request_start(self, route) -> None:
+        """Called before each attempt of a request waits on the rate limiter and scheduler."""
+
+    def on_response(self, route, status: int, elapsed: float, waited: float, bytes_in: int, bytes_out: int) -> None:
+        """Called when each attempt of a request has received a response, whatever its status.
+
+        Parameters
+        ------------
+        route: :class:`Route`
+            The route that was requested.
+        status: :class:`int`
+            The HTTP status code of the response.
+        elapsed: :class:`float`
+            The number of seconds between sending the request and reading the whole response.
+        waited: :class:`float`
+            The number of seconds spent waiting on the rate limiter and scheduler before the request was sent.
+        bytes_in: :class:`int`
+            The size of the response body.
+        bytes_out: :class:`int`
+            The size of the request body.
+        """
+
+    def on_ratelimit(self, route, bucket: str, retry_after: float, is_global: bool) -> None:
+        """Called when a request has received a 429 response."""
+
+    def on_retry(self, route, attempt: int, delay: float, error: Exception) -> None:
+        """Called before a request is retried after ``delay`` seconds because of ``error``."""
+
+    def on_error(self, route, error: Exception) -> None:
+        """Called when a request raises an exception to the caller, after any retries."""
+
+
+class Histogram:
+
+    """Counts observations into cumulative buckets, like a Prometheus histogram."""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            yield bound, total
+
+
+def _labels(**labels) -> str:
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return '{' + pairs + '}'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+class MetricsCollector(Hooks):
+
+    """Collects request metrics per route and renders them in the Prometheus text format.
+
+    Routes are identified by their method and template, where IDs in the path are replaced with ``{id}``, and webhook
+    tokens, emoji and invite codes with ``{token}``, ``{emoji}`` and ``{code}``, e.g. ``GET /channels/{id}/messages``.
+    The number of series does not grow with the number of channels or guilds and no secret is ever used as a label.
+
+    Parameters
+    ------------
+    scheduler: Optional[:class:`RequestScheduler`]
+        The scheduler to report the number of queued and in flight requests of.
+    latency_buckets: Sequence[:class:`float`]
+        The upper bounds, in seconds, of the request latency and rate limit wait histograms.
+        Defaults to :attr:`DEFAULT_BUCKETS`.
+
+    Example
+    ----------
+        metrics = MetricsCollector()
+        client = RestCord(token, hooks=[metrics])
+        ...
+        print(metrics.render())
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    __slots__ = ('scheduler', 'latency_buckets', 'latency', 'wait', 'responses', 'bytes_in', 'bytes_out', 'ratelimits', 'retries', 'errors')
+
+    def __init__(self, scheduler=None, latency_buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.scheduler = scheduler
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.clear()
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} routes={len(self.latency)}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def clear(self) -> None:
+        """Resets every metric."""
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.wait: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.bytes_in: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.bytes_out: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.ratelimits: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self.retries: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.errors: Dict[Tuple[str, str, str], int] = defaultdict(int)
+
+    def on_response(self, route, status: int, elapsed: float, waited: float, bytes_in: int, bytes_out: int) -> None:
+        key = (route.method, route.template)
+
+        latency = self.latency.get(key)
+        if latency is None:
+            latency = self.latency[key] = Histogram(self.latency_buckets)
+            self.wait[key] = Histogram(self.latency_buckets)
+        latency.observe(elapsed)
+        self.wait[key].observe(waited)
+
+        self.responses[key + (status,)] += 1
+        self.bytes_in[key] += bytes_in
+        self.bytes_out[key] += bytes_out
+
+    def on_ratelimit(self, route, bucket: str, retry_after: float, is_global: bool) -> None:
+        self.ratelimits[(route.method, route.template, 'true' if is_global else 'false')] += 1
+
+    def on_retry(self, route, attempt: int, delay: float, error: Exception) -> None:
+        self.retries[(route.method, route.template)] += 1
+
+    def on_error(self, route, error: Exception) -> None:
+        self.errors[(route.method, route.template, type(error).__name__)] += 1
+
+    def slowest(self, n: int = 10) -> Sequence[Tuple[str, float]]:
+        """Gets the routes with the highest mean latency, including rate limit waits, slowest first.
+
+        Returns
+        ---------
+        List[Tuple[:class:`str`, :class:`float`]]
+            Pairs of ``METHOD template`` and mean seconds per request.
+        """
+        means = [
+            (f'{method} {template}', (latency.sum + self.wait[(method, template)].sum) / latency.count)
+            for (method, template), latency in self.latency.items()
+        ]
+        means.sort(key=lambda pair: pair[1], reverse=True)
+        return means[:n]
+
+    def render(self, prefix: str = 'restcord') -> str:
+        """Renders every metric in the Prometheus text exposition format.
+
+        Parameters
+        ------------
+        prefix: :class:`str`
+            The prefix of every metric name.
+            Defaults to ``restcord``.
+        """
+        lines = []
+
+        def histogram(name: str, help: str, histograms: Dict[Tuple[str, str], Histogram]) -> None:
+            lines.append(f'# HELP {prefix}_{name} {help}')
+            lines.append(f'# TYPE {prefix}_{name} histogram')
+            for (method, route), h in histograms.items():
+                for bound, count in h.cumulative():
+                    lines.append(f'{prefix}_{name}_bucket{_labels(method=method, route=route, le=bound)} {count}')
+                lines.append(f'{prefix}_{name}_bucket{_labels(method=method, route=route, le="+Inf")} {h.count}')
+                lines.append(f'{prefix}_{name}_sum{_labels(method=method, route=route)} {h.sum}')
+                lines.append(f'{prefix}_{name}_count{_labels(method=method, route=route)} {h.count}')
+
+        def counter(name: str, help: str, counts: Dict[tuple, int], *names: str) -> None:
+            lines.append(f'# HELP {prefix}_{name} {help}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for key, count in counts.items():
+                lines.append(f'{prefix}_{name}{_labels(**dict(zip(names, key)))} {count}')
+
+        histogram('request_duration_seconds', 'Time from sending a request to reading its response.', self.latency)
+        histogram('ratelimit_wait_seconds', 'Time a request waited on the rate limiter and scheduler before it was sent.', self.wait)
+        counter('responses_total', 'Responses received by status code.', self.responses, 'method', 'route', 'status')
+        counter('response_bytes_total', 'Bytes received in response bodies.', self.bytes_in, 'method', 'route')
+        counter('request_bytes_total', 'Bytes sent in request bodies.', self.bytes_out, 'method', 'route')
+        counter('ratelimited_total', '429 responses received, by whether the global rate limit was hit.', self.ratelimits, 'method', 'route', 'global')
+        counter('retries_total', 'Requests retried after a 429, 500 or 502 response.', self.retries, 'method', 'route')
+        counter('errors_total', 'Exceptions raised to the caller by type.', self.errors, 'method', 'route', 'error')
+
+        if self.scheduler is not None:
+            lines.append(f'# HELP {prefix}_scheduler_queued Requests waiting to be admitted by the scheduler.')
+            lines.append(f'# TYPE {prefix}_scheduler_queued gauge')
+            lines.append(f'{prefix}_scheduler_queued {self.scheduler.queued}')
+            lines.append(f'# HELP {prefix}_scheduler_in_flight Requests admitted by the scheduler.')
+            lines.append(f'# TYPE {prefix}_scheduler_in_flight gauge')
+            lines.append(f'{prefix}_scheduler_in_flight {self.scheduler.in_flight}')
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Mapping
+
+__all__ = (
+    'Model',
+    'lazy'
+)
+
+_lazy = ContextVar('restcord_lazy', default=False)
+
+
+def is_lazy() -> bool:
+    """Whether models built in the current context build their nested models and timestamps lazily."""
+    return _lazy.get()
+
+
+@contextmanager
+def lazy(enabled: bool = True):
+    """Makes every model built inside the block, and in tasks started from it, build its nested models and timestamps
+    the first time each is accessed instead of straight away.
+
+    A lazy model keeps its payload until it is dropped, which is cheaper when only a few fields of many models are read
+    but holds more memory for as long as the models are kept.
+
+    Example
+    ----------
+        with lazy():
+            messages = await client.channel_client.get_messages(channel_id, limit=100)
+            contents = [message.content for message in messages]
+    """
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+class Model:
+
+    """Base class for the models built from Discord's payloads.
+
+    Models are built from a decoded payload with :meth:`from_dict`, which subclasses read in ``_update``. Building them
+    with keyword arguments, e.g. ``Ban(**payload)``, is still supported but copies the payload.
+
+    Subclasses that can build fields lazily keep the payload in ``_data`` and list those fields in ``_lazy_fields``.
+    Unless :func:`lazy` is active the fields are built straight away and the payload is let go.
+    """
+
+    __slots__ = ()
+
+    _lazy_fields = ()
+
+    def __init__(self, **kwargs):
+        self._update(kwargs)
+        self._load()
+
+    @classmethod
+    def _new(cls, data: Mapping[str, Any]):
+        return object.__new__(cls)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]):
+        """Builds the model from a decoded payload without copying it.
+
+        Models built while :func:`lazy` is active keep a reference to the payload, so it should not be modified
+        afterwards.
+        """
+        self = cls._new(data)
+        self._update(data)
+        self._load()
+        return self
+
+    def _update(self, data: Mapping[str, Any]) -> None:
+        pass
+
+    def _load(self) -> None:
+        if not self._lazy_fields or is_lazy():
+            return
+
+        for name in self._lazy_fields:
+            getattr(self, name)
+        self._data = None
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from typing import Optional
+
 from .snowflake import Snowflake
 
 __all__ = (
@@ -10,11 +12,16 @@ class PermissionOverwrite(Snowflake):
 
     __slots__ = ('type', 'allow', 'deny', 'allow_new', 'deny_new')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    @classmethod
+    def _identity(cls, data) -> Optional[int]:
+        # The ID is a role's or user's, which has a different overwrite in every channel, so overwrites are never interned.
+        return None
+
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.type = kwargs.get('type')
-        self.allow = kwargs.get('allow')
-        self.deny = kwargs.get('deny')
-        self.allow_new = kwargs.get('allow_new')
-        self.deny_new = kwargs.get('deny_new')
+        self.type = data.get('type')
+        self.allow = data.get('allow')
+        self.deny = data.get('deny')
+        self.allow_new = data.get('allow_new')
+        self.deny_new = data.get('deny_new')
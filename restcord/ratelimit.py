@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import datetime
+import logging
+import time
+from typing import Dict, Optional
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'Bucket',
+    'RateLimiter'
+)
+
+
+def parse_reset_after(headers, *, use_clock=False) -> Optional[float]:
+    """Gets the number of seconds until a rate limit bucket resets from the response headers."""
+    reset_after = headers.get('X-Ratelimit-Reset-After')
+    if use_clock or not reset_after:
+        reset = headers.get('X-Ratelimit-Reset')
+        if not reset:
+            return None
+        utc = datetime.timezone.utc
+        now = datetime.datetime.now(utc)
+        reset = datetime.datetime.fromtimestamp(float(reset), utc)
+        return (reset - now).total_seconds()
+    else:
+        return float(reset_after)
+
+
+class Bucket:
+
+    """The state of a single Discord rate limit bucket.
+
+    Attributes
+    ------------
+    key: :class:`str`
+        The key the bucket is stored against in the :class:`RateLimiter`.
+    limit: Optional[:class:`int`]
+        The number of requests that can be made per window, or ``None`` if not yet known.
+    remaining: Optional[:class:`int`]
+        The number of requests left in the current window, or ``None`` if not yet known.
+    reset_at: Optional[:class:`float`]
+        The monotonic time the current window ends, or ``None`` if not yet known.
+    """
+
+    __slots__ = ('key', 'limit', 'remaining', 'reset_at', '__lock', '__discovered', '__pending', '__users', '__reserved', '__reset')
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+        self.__lock = asyncio.Lock()
+        self.__discovered = False
+        self.__pending = None
+        self.__users = 0
+        self.__reserved = 0
+        self.__reset = None
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} key={self.key}, limit={self.limit}, remaining={self.remaining}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    async def acquire(self) -> float:
+        """|coro| Waits until a request can be sent in this bucket and reserves it.
+
+        Callers queue on the bucket in FIFO order. Whenever the state of the bucket is unknown, either because it has
+        never been used or because its window has just reset, requests are held back until a response in flight reports
+        the new limits. :meth:`release` must be called once the response has been received.
+
+        Returns
+        ---------
+        :class:`float`
+            The number of seconds spent waiting for the bucket.
+        """
+        start = time.monotonic()
+        self.__users += 1
+        try:
+            await self.__reserve()
+        except BaseException:
+            self.__users -= 1
+            raise
+
+        return time.monotonic() - start
+
+    async def __reserve(self) -> None:
+        async with self.__lock:
+            while True:
+                if self.__pending is not None:
+                    await self.__pending.wait()
+                    continue
+
+                if not self.__discovered:
+                    self.__pending = asyncio.Event()
+                    break
+
+                if self.remaining != 0:
+                    break
+
+                if self.reset_at is None:
+                    self.__pending = asyncio.Event()
+                    continue
+
+                delay = self.reset_at - time.monotonic()
+                if delay <= 0:
+                    self.remaining = self.limit
+                    self.reset_at = None
+                    continue
+
+                __log__.debug('Bucket %s is exhausted, waiting %.2f seconds.', self.key, delay)
+                await asyncio.sleep(delay)
+
+            if self.remaining:
+                self.remaining -= 1
+            self.__reserved += 1
+
+    def release(self) -> None:
+        """Signals that the response to a request reserved with :meth:`acquire` has been received."""
+        self.__users -= 1
+        self.__reserved -= 1
+        self.__discovered = True
+
+        # The response did not report a new window, so there is nothing left to wait for.
+        if self.remaining == 0 and self.reset_at is None:
+            self.remaining = None
+
+        if self.__pending is not None:
+            self.__pending.set()
+            self.__pending = None
+
+    def update(self, headers) -> None:
+        """Updates the bucket from the ``X-Ratelimit-*`` headers of a response."""
+        remaining = headers.get('X-Ratelimit-Remaining')
+        if remaining is None:
+            return
+
+        limit = headers.get('X-Ratelimit-Limit')
+        if limit is not None:
+            self.limit = int(limit)
+
+        now = time.monotonic()
+        reset = headers.get('X-Ratelimit-Reset')
+        reset = float(reset) if reset else None
+
+        # Within a window, requests still in flight were already reserved locally, so never trust a higher count. A
+        # response from a new window reports the fresher count, less the other requests in flight it may not include.
+        remaining = int(remaining)
+        if self.remaining is None or remaining < self.remaining:
+            self.remaining = remaining
+        elif self.reset_at is None or self.reset_at <= now or (reset is not None and self.__reset is not None and reset > self.__reset):
+            self.remaining = max(remaining - max(self.__reserved - 1, 0), 0)
+
+        if reset is not None:
+            self.__reset = reset
+
+        reset_after = parse_reset_after(headers)
+        if reset_after is not None:
+            self.reset_at = now + reset_after
+
+    def is_idle(self, now: float) -> bool:
+        """Whether no request is waiting for or holding the bucket and its window, if any, ended before ``now``."""
+        return self.__users == 0 and (self.reset_at is None or self.reset_at <= now)
+
+    def exhaust(self, retry_after: float) -> None:
+        """Marks the bucket as exhausted for ``retry_after`` seconds, typically after a 429."""
+        self.remaining = 0
+        self.reset_at = time.monotonic() + retry_after
+
+
+class RateLimiter:
+
+    """Keeps track of Discord's rate limits so that requests wait before they are sent rather than being rejected.
+
+    Each :class:`Route` is keyed by its method, path and major parameter. Once Discord reports the ``X-Ratelimit-Bucket``
+    for a route, every route sharing that bucket and major parameter will share the same :class:`Bucket`.
+
+    The global rate limit is enforced for every request made through the limiter, so a single instance should be shared
+    by every :class:`HTTPClient` using the same token.
+
+    Bucket keys include IDs, emoji, invite codes and webhook tokens, so buckets that are idle once their window has
+    ended are discarded every ``prune_interval`` seconds to keep a long running client from growing without bound.
+
+    Parameters
+    ------------
+    global_limit: :class:`int`
+        The number of requests that can be sent per second across all routes.
+        Defaults to ``50``.
+    prune_interval: :class:`float`
+        How many seconds pass between discarding idle buckets.
+        Defaults to ``60``.
+    """
+
+    __slots__ = ('global_limit', 'prune_interval', '__routes', '__buckets', '__global_reset_at', '__window_start', '__window_count', '__pruned_at')
+
+    def __init__(self, global_limit: int = 50, prune_interval: float = 60.0) -> None:
+        self.global_limit = global_limit
+        self.prune_interval = prune_interval
+        self.__routes: Dict[str, str] = {}
+        self.__buckets: Dict[str, Bucket] = {}
+        self.__global_reset_at = 0.0
+        self.__window_start = 0.0
+        self.__window_count = 0
+        self.__pruned_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    @property
+    def is_global_limited(self) -> bool:
+        """:class:`bool`: Whether Discord has reported that the global rate limit has been hit."""
+        return self.__global_reset_at > time.monotonic()
+
+    def __key(self, route) -> str:
+        return self.__routes.get(route.bucket, route.bucket)
+
+    def get_bucket(self, route) -> Bucket:
+        """Gets the :class:`Bucket` for a route, creating it if it has not been seen before."""
+        now = time.monotonic()
+        if now - self.__pruned_at >= self.prune_interval:
+            self.prune(now)
+
+        key = self.__key(route)
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            bucket = self.__buckets[key] = Bucket(key)
+        return bucket
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Discards the buckets that no request is using and whose window has ended, and the routes mapped to them.
+
+        Returns
+        ---------
+        :class:`int`
+            The number of buckets discarded.
+        """
+        now = time.monotonic() if now is None else now
+        self.__pruned_at = now
+
+        idle = [key for key, bucket in self.__buckets.items() if bucket.is_idle(now)]
+        for key in idle:
+            del self.__buckets[key]
+
+        if idle:
+            self.__routes = {route: key for route, key in self.__routes.items() if key in self.__buckets}
+            __log__.debug('Discarded %d idle rate limit buckets.', len(idle))
+
+        return len(idle)
+
+    async def acquire_global(self) -> float:
+        """|coro| Waits until a request can be sent without exceeding the global rate limit and reserves it.
+
+        Returns
+        ---------
+        :class:`float`
+            The number of seconds spent waiting.
+        """
+        start = time.monotonic()
+        while True:
+            now = time.monotonic()
+            if self.__global_reset_at > now:
+                await asyncio.sleep(self.__global_reset_at - now)
+                continue
+
+            if now - self.__window_start >= 1.0:
+                self.__window_start = now
+                self.__window_count = 0
+
+            if self.__window_count < self.global_limit:
+                self.__window_count += 1
+                break
+
+            await asyncio.sleep(self.__window_start + 1.0 - now)
+
+        return time.monotonic() - start
+
+    def set_global(self, retry_after: float) -> None:
+        """Holds back every request made through the limiter for ``retry_after`` seconds after a global 429."""
+        __log__.warning('The global rate limit has been hit, retrying in %.2f seconds.', retry_after)
+        self.__global_reset_at = max(self.__global_reset_at, time.monotonic() + retry_after)
+
+    def update(self, route, bucket: Bucket, headers) -> Bucket:
+        """Updates the rate limit state for a route from a response's headers.
+
+        Returns
+        ---------
+        :class:`Bucket`
+            The bucket the route now belongs to.
+        """
+        bucket_hash = headers.get('X-Ratelimit-Bucket')
+        if bucket_hash is not None:
+            key = f'{bucket_hash}:{route.major_parameter}'
+            if self.__routes.get(route.bucket) != key:
+                self.__routes[route.bucket] = key
+                bucket = self.__buckets.setdefault(key, bucket)
+
+        bucket.update(headers)
+        return bucket
@@ -12,16 +12,16 @@ class Role(Designation):
 
     __slots__ = ('permissions', 'position', 'color', 'hoist', 'managed', 'mentionable', 'permissions_new')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
-        self.permissions = kwargs.get('permissions')
-        self.position = kwargs.get('position')
-        self.color = kwargs.get('color')
-        self.hoist = kwargs.get('hoist')
-        self.managed = kwargs.get('managed')
-        self.mentionable = kwargs.get('mentionable')
-        self.permissions_new = kwargs.get('permissions_new')
+    def _update(self, data) -> None:
+        super()._update(data)
+
+        self.permissions = data.get('permissions')
+        self.position = data.get('position')
+        self.color = data.get('color')
+        self.hoist = data.get('hoist')
+        self.managed = data.get('managed')
+        self.mentionable = data.get('mentionable')
+        self.permissions_new = data.get('permissions_new')
 
     @property
     def mention(self) -> str:
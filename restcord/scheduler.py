@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'Priority',
+    'RequestScheduler',
+    'priority'
+)
+
+
+class Priority(IntEnum):
+
+    """The priority classes requests are scheduled in. Lower values are sent first."""
+
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+
+_priority = ContextVar('restcord_priority', default=Priority.DEFAULT)
+
+
+def current() -> Priority:
+    """Gets the priority requests are made with in the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def priority(level: Priority):
+    """Makes every request sent inside the block, and in tasks started from it, with a priority.
+
+    Example
+    ----------
+        with priority(Priority.INTERACTIVE):
+            await client.channel_client.delete_message(channel_id, message_id)
+    """
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+
+    """Limits how many requests are in flight at once and decides which waiting request goes next.
+
+    Waiting requests are admitted in order of :class:`Priority`, and in the order they arrived within a priority, so
+    interactive calls are not starved by bulk traffic sharing the same token. Requests sharing a rate limit bucket are
+    additionally queued in order by their :class:`Bucket`.
+
+    Parameters
+    ------------
+    max_in_flight: :class:`int`
+        The maximum number of requests in flight at once.
+        Defaults to ``25``.
+
+    Attributes
+    ------------
+    in_flight: :class:`int`
+        The number of requests currently admitted.
+    """
+
+    __slots__ = ('max_in_flight', 'in_flight', '__queue', '__counter', '__waiting')
+
+    def __init__(self, max_in_flight: int = 25) -> None:
+        if max_in_flight < 1:
+            raise ValueError("Argument must be at least 1: max_in_flight")
+
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.__queue = []
+        self.__counter = itertools.count()
+        self.__waiting = 0
+
+    def __str__(self) -> str:
+        return f'<{type(self).__name__} in_flight={self.in_flight}, queued={self.queued}>'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    @property
+    def queued(self) -> int:
+        """:class:`int`: The number of requests waiting to be admitted."""
+        return self.__waiting
+
+    async def acquire(self, level: Priority = None) -> float:
+        """|coro| Waits until a request may be sent. :meth:`release` must be called once its response has been received.
+
+        Parameters
+        ------------
+        level: Optional[:class:`Priority`]
+            The priority of the request. Defaults to the priority of the current context.
+
+        Returns
+        ---------
+        :class:`float`
+            The number of seconds spent waiting.
+        """
+        # Drop waiters that were cancelled while queued so they don't hold back new requests.
+        while self.__queue and self.__queue[0][2].done():
+            heapq.heappop(self.__queue)
+
+        if self.in_flight < self.max_in_flight and not self.__queue:
+            self.in_flight += 1
+            return 0.0
+
+        start = time.monotonic()
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self.__queue, (current() if level is None else level, next(self.__counter), future))
+
+        self.__waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the waiter was cancelled.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            self.__waiting -= 1
+
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        """Frees the slot of a request admitted by :meth:`acquire` and admits the next waiting request."""
+        self.in_flight -= 1
+
+        while self.__queue and self.in_flight < self.max_in_flight:
+            _, _, future = heapq.heappop(self.__queue)
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
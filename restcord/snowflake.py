@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
 from abc import ABC
+from datetime import datetime
+from typing import Any, Mapping, Optional
+
+from restcord import identity, utils
+
+from .model import Model
 
 __all__ = (
     'Snowflake',
@@ -7,23 +13,86 @@ __all__ = (
 )
 
 
-class Snowflake(ABC):
+class Snowflake(Model, ABC):
+
+    """Abstract base class depicting a Discord object that has an ID.
+
+    The ID, and the IDs of other objects a model refers to such as ``channel_id``, are stored as :class:`int`. The time
+    the object was created can be read from the ID without a request. Snowflakes are equal, and hash the same, when they
+    are of the same type and their IDs are equal, so a guild and its ``@everyone`` role, which share an ID, are not.
+
+    While an :class:`IdentityMap` is active, building a snowflake whose type and ID are already in the map updates and
+    returns the existing instance.
+    """
+
+    __slots__ = ('id', '__weakref__')
+
+    # The type IDs are stored as. Discord's IDs are snowflakes, except for the few objects identified by name.
+    _id_type = int
+
+    def __new__(cls, **kwargs):
+        return cls._new(kwargs)
+
+    @classmethod
+    def _new(cls, data):
+        identity_map = identity.current()
+        if identity_map is None:
+            return object.__new__(cls)
 
-    """Abstract base class depicting a Discord object that has an ID."""
+        id = cls._identity(data)
+        if id is None:
+            return object.__new__(cls)
 
-    __slots__ = ('id')
+        instance = identity_map.get(cls, id)
+        if instance is None:
+            instance = object.__new__(cls)
+            identity_map.add(cls, id, instance)
+        else:
+            # __init__ runs again with the new payload, so forget anything built lazily from the old one.
+            for klass in cls.__mro__:
+                for slot in getattr(klass, '__slots__', ()):
+                    if slot.startswith('_cs_') and hasattr(instance, slot):
+                        delattr(instance, slot)
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get('id')
+        return instance
+
+    @classmethod
+    def _identity(cls, data) -> Optional[Any]:
+        return utils.try_cast(data.get('id'), cls._id_type)
+
+    def _update(self, data: Mapping[str, Any]) -> None:
+        self.id = utils.try_cast(data.get('id'), self._id_type)
 
     def __str__(self) -> str:
         return f'<{type(self).__name__} id={self.id}>'
 
-    def __repr__(self) -> str:
-        return self.__str__()
-
     def __eq__(self, other) -> bool:
-        return self.id == other.id
+        if not isinstance(other, Snowflake):
+            return NotImplemented
+        return type(self) is type(other) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.id))
+
+    @property
+    def created_at(self) -> datetime:
+        """:class:`datetime.datetime`: When the object was created, in UTC."""
+        return utils.snowflake_time(self.id)
+
+    @property
+    def worker_id(self) -> int:
+        """:class:`int`: The internal ID of the worker that generated the snowflake."""
+        return (self.id & 0x3E0000) >> 17
+
+    @property
+    def process_id(self) -> int:
+        """:class:`int`: The internal ID of the process that generated the snowflake."""
+        return (self.id & 0x1F000) >> 12
+
+    @property
+    def increment(self) -> int:
+        """:class:`int`: The number of snowflakes the process had generated before this one."""
+        return self.id & 0xFFF
 
 
 class Designation(Snowflake):
@@ -32,10 +101,10 @@ class Designation(Snowflake):
 
     __slots__ = ('name')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.name = kwargs.get('name')
+        self.name = data.get('name')
 
     def __str__(self) -> str:
         return f'<{type(self).__name__} id={self.id}, name={self.name}>'
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import codecs
+import json
+import logging
+import re
+from typing import Any, List
+
+__log__ = logging.getLogger(__name__)
+
+__all__ = (
+    'JSONArrayDecoder',
+)
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class JSONArrayDecoder:
+
+    """Incrementally decodes a top-level JSON array, returning each element as soon as it has been received in full.
+
+    Only the element being received is buffered, not the whole body. Elements are decoded with the standard library's
+    C scanner, which can decode one value from the middle of a buffer.
+
+    Example
+    ----------
+        decoder = JSONArrayDecoder()
+        async for chunk in response.content.iter_any():
+            for element in decoder.feed(chunk):
+                ...
+        decoder.close()
+    """
+
+    __slots__ = ('__text', '__buffer', '__state', '__scan')
+
+    def __init__(self) -> None:
+        self.__text = codecs.getincrementaldecoder('utf-8')()
+        self.__buffer = ''
+        self.__state = 'start'
+        self.__scan = json.JSONDecoder().raw_decode
+
+    @property
+    def done(self) -> bool:
+        """:class:`bool`: Whether the closing bracket of the array has been received."""
+        return self.__state == 'done'
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds the next chunk of the body and returns the elements it completed.
+
+        Raises
+        ------------
+        ValueError
+            The body is not a JSON array.
+        """
+        buffer = self.__buffer + self.__text.decode(chunk)
+        end = len(buffer)
+        pos = 0
+        elements = []
+
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos == end:
+                break
+
+            state = self.__state
+            if state == 'value':
+                try:
+                    element, after = self.__scan(buffer, pos)
+                except json.JSONDecodeError:
+                    # The element has not been received in full yet.
+                    break
+
+                # A number cut off by the end of the chunk, such as 1.5 from 1.5e3, decodes without error, so only accept
+                # an element once the separator after it has been received.
+                following = WHITESPACE.match(buffer, after).end()
+                if following == end or buffer[following] not in ',]':
+                    break
+
+                elements.append(element)
+                pos = after
+                self.__state = 'separator'
+            elif state == 'separator':
+                if buffer[pos] == ',':
+                    self.__state = 'value'
+                elif buffer[pos] == ']':
+                    self.__state = 'done'
+                else:
+                    raise ValueError(f'Expected "," or "]" at position {pos} of the buffered JSON array.')
+                pos += 1
+            elif state == 'start':
+                if buffer[pos] != '[':
+                    raise ValueError('The response is not a JSON array.')
+                self.__state = 'first'
+                pos += 1
+            elif state == 'first':
+                if buffer[pos] == ']':
+                    self.__state = 'done'
+                    pos += 1
+                else:
+                    self.__state = 'value'
+            else:
+                raise ValueError('Unexpected data after the end of the JSON array.')
+
+        self.__buffer = buffer[pos:]
+        return elements
+
+    def close(self) -> None:
+        """Checks that the whole array has been received.
+
+        Raises
+        ------------
+        ValueError
+            The body ended before the array did, or an element could not be decoded.
+        """
+        if self.__state != 'done':
+            raise ValueError('The JSON array is incomplete or malformed.')
+
@@ -12,13 +12,13 @@ class User(Designation):
 
     __slots__ = ('discriminator', 'avatar', 'public_flags')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.name = kwargs.get('username')
-        self.discriminator = kwargs.get('discriminator')
-        self.avatar = kwargs.get('avatar')
-        self.public_flags = kwargs.get('public_flags')
+        self.name = data.get('username')
+        self.discriminator = data.get('discriminator')
+        self.avatar = data.get('avatar')
+        self.public_flags = data.get('public_flags')
 
     def __str__(self):
         return f'<{type(self).__name__} id={self.id}, name={self.name}, discriminator={self.discriminator}>'
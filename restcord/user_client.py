@@ -27,8 +27,8 @@ class UserClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_user(self, user_id: int) -> User:
         """|coro| Get a user.
@@ -52,4 +52,4 @@ class UserClient(HTTPClient):
 
         user = await self._request(Route('GET', f'/users/{user_id}'))
 
-        return User(**user)
+        return User.from_dict(user)
@@ -1,15 +1,145 @@
 # -*- coding: utf-8 -*-
+import json
 import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def parse_time(timestamp):
-    if timestamp:
-        return datetime(*map(int, re.split(r'[^\d]', timestamp.replace('+00:00', ''))))
-    return None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+elif ujson is not None:
+    JSON_BACKEND = 'ujson'
+else:
+    JSON_BACKEND = 'json'
+
+
+class cached_slot_property:
+
+    """A property that is computed on first access and then stored in a slot of the instance.
+
+    Assigning to the property stores the value in the slot directly.
+
+    Parameters
+    ------------
+    name: :class:`str`
+        The name of the slot the value is stored in.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.function = None
+
+    def __call__(self, function):
+        self.function = function
+        self.__doc__ = function.__doc__
+        return self
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.name)
+        except AttributeError:
+            value = self.function(instance)
+            setattr(instance, self.name, value)
+            return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.name, value)
+
+
+DISCORD_EPOCH = 1420070400000
+
+ISO_8601 = re.compile(r'(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(?:\.(\d{1,6})\d*)?(Z|[+-]\d\d:?\d\d)?')
+
+
+def parse_time(timestamp: Optional[str]) -> Optional[datetime]:
+    """Parses one of Discord's ISO 8601 timestamps into a timezone aware datetime, keeping microseconds."""
+    if not timestamp:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        # Older versions of Python only accept 'Z' suffixes and 3 or 6 fractional digits from Python 3.11.
+        parsed = _parse_time_fallback(timestamp)
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _parse_time_fallback(timestamp: str) -> datetime:
+    match = ISO_8601.fullmatch(timestamp)
+    if match is None:
+        raise ValueError(f'Invalid ISO 8601 timestamp: {timestamp}')
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+
+    tz = timezone.utc
+    if offset and offset != 'Z':
+        offset = offset.replace(':', '')
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        tz = timezone(-delta if offset[0] == '-' else delta)
+
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond, tzinfo=tz)
 
 
 def try_cast(value, cast_to: type):
     if not value:
         return None
     return cast_to(value)
+
+
+def to_json(obj: Any) -> Union[str, bytes]:
+    """Encodes an object as compact JSON using the fastest backend installed (orjson, ujson or the standard library)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=True, escape_forward_slashes=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+
+
+def from_json(data: Union[str, bytes]) -> Any:
+    """Decodes JSON, including UTF-8 encoded bytes, using the fastest backend installed (orjson, ujson or the standard library)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def snowflake_time(snowflake: int) -> datetime:
+    """Gets the timezone aware datetime a Discord snowflake was created at."""
+    return datetime.fromtimestamp(((int(snowflake) >> 22) + DISCORD_EPOCH) / 1000, tz=timezone.utc)
+
+
+def time_snowflake(moment: datetime, high: bool = False) -> int:
+    """Builds a snowflake for a datetime, for use as a ``before`` or ``after`` cursor.
+
+    Naive datetimes are treated as UTC.
+
+    Parameters
+    ------------
+    moment: :class:`datetime.datetime`
+        The datetime to build the snowflake for.
+    high: :class:`bool`
+        Whether to set the worker, process and increment bits, giving the highest snowflake for the millisecond.
+        Use ``False`` for ``before`` cursors and ``True`` for ``after`` cursors so that the millisecond is excluded.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+
+    discord_millis = int(moment.timestamp() * 1000 - DISCORD_EPOCH)
+    return (discord_millis << 22) + (2 ** 22 - 1 if high else 0)
@@ -8,14 +8,19 @@ __all__ = (
 
 class VoiceRegion(Designation):
 
-    """Model depicting a Discord voice region object."""
+    """Model depicting a Discord voice region object.
+
+    Voice regions are identified by name, e.g. ``us-west``, so their ID is a :class:`str` and has no creation time.
+    """
 
     __slots__ = ('vip', 'optimal', 'deprecated', 'custom')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    _id_type = str
+
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.vip = kwargs.get('vip')
-        self.optimal = kwargs.get('optimal')
-        self.deprecated = kwargs.get('deprecated')
-        self.custom = kwargs.get('custom')
+        self.vip = data.get('vip')
+        self.optimal = data.get('optimal')
+        self.deprecated = data.get('deprecated')
+        self.custom = data.get('custom')
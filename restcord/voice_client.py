@@ -27,8 +27,8 @@ class VoiceClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_voice_regions(self) -> List[VoiceRegion]:
         """|coro| Get a list of voice regions.
@@ -45,4 +45,4 @@ class VoiceClient(HTTPClient):
 
         voice_regions = await self._request(Route('GET', '/voice/regions'))
 
-        return [VoiceRegion(**voice_region) for voice_region in voice_regions]
+        return [VoiceRegion.from_dict(voice_region) for voice_region in voice_regions]
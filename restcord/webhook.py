@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from restcord import utils
+
 from .snowflake import Designation
 from .user import User
 
@@ -13,17 +15,17 @@ class Webhook(Designation):
 
     __slots__ = ('type', 'guild_id', 'channel_id', 'avatar', 'token', 'user')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def _update(self, data) -> None:
+        super()._update(data)
 
-        self.type = kwargs.get('type')
-        self.guild_id = kwargs.get('guild_id')
-        self.channel_id = kwargs.get('channel_id')
-        self.avatar = kwargs.get('avatar')
-        self.token = kwargs.get('token')
+        self.type = data.get('type')
+        self.guild_id = utils.try_cast(data.get('guild_id'), int)
+        self.channel_id = utils.try_cast(data.get('channel_id'), int)
+        self.avatar = data.get('avatar')
+        self.token = data.get('token')
 
-        user = kwargs.get('user')
+        user = data.get('user')
         if user:
-            self.user = User(**user)
+            self.user = User.from_dict(user)
         else:
             self.user = None
@@ -27,8 +27,8 @@ class WebhookClient(HTTPClient):
         The class that handles the HTTP requests and responses including rate limit handling and HTTP status codes.
     """
 
-    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None) -> None:
-        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session)
+    def __init__(self, token: str, loop=None, proxy=None, proxy_auth=None, session: Optional[ClientSession] = None, **kwargs) -> None:
+        super().__init__(token=token, loop=loop, proxy=proxy, proxy_auth=proxy_auth, session=session, **kwargs)
 
     async def get_webhook(self, webhook_id: int) -> Webhook:
         """|coro| Get a webhook.
@@ -52,7 +52,7 @@ class WebhookClient(HTTPClient):
 
         webhook = await self._request(Route('GET', f'/webhooks/{webhook_id}'))
 
-        return Webhook(**webhook)
+        return Webhook.from_dict(webhook)
 
     async def get_webhook_with_token(self, webhook_id: int, token: str) -> Webhook:
         """|coro| Get a webhook with token.
@@ -81,7 +81,7 @@ class WebhookClient(HTTPClient):
 
         webhook = await self._request(Route('GET', f'/webhooks/{webhook_id}/{token}'))
 
-        return Webhook(**webhook)
+        return Webhook.from_dict(webhook)
 
     async def get_channel_webhooks(self, channel_id: int) -> List[Webhook]:
         """|coro| Get a list of a channel's webhooks.
@@ -105,7 +105,7 @@ class WebhookClient(HTTPClient):
 
         webhooks = await self._request(Route('GET', f'/channels/{channel_id}/webhooks'))
 
-        return [Webhook(**webhook) for webhook in webhooks]
+        return [Webhook.from_dict(webhook) for webhook in webhooks]
 
     async def get_guild_webhooks(self, guild_id: int) -> List[Webhook]:
         """|coro| Get a list of a guild's webhooks.
@@ -129,7 +129,7 @@ class WebhookClient(HTTPClient):
 
         webhooks = await self._request(Route('GET', f'/guilds/{guild_id}/webhooks'))
 
-        return [Webhook(**webhook) for webhook in webhooks]
+        return [Webhook.from_dict(webhook) for webhook in webhooks]
 
     async def delete_webhook(self, webhook_id: int) -> None:
         """|coro| Deletes a webhook.
@@ -24,6 +24,9 @@ setuptools.setup(
     keywords='discord rest api python asynchronous',
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require={
+        'speed': ['orjson']
+    },
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
         'License :: OSI Approved :: MIT License',
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from contextlib import asynccontextmanager
+
+from benchmarks.fake_discord import FakeDiscord
+from restcord.http import Route
+
+
+@asynccontextmanager
+async def serve(server: FakeDiscord):
+    """Serves a :class:`FakeDiscord` and points every :class:`Route` at it until the block exits."""
+    base = Route.BASE
+    Route.BASE = await server.start()
+    try:
+        yield server
+    finally:
+        Route.BASE = base
+        await server.stop()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from benchmarks.fake_discord import FakeDiscord
+from restcord import ResponseCache, RestCord
+from restcord.cache import MISSING
+from restcord.http import Route
+
+from .helpers import serve
+
+
+def test_mutations_evict_related_paths():
+    cache = ResponseCache()
+    for path in ('/guilds/1', '/guilds/1/emojis', '/guilds/1/emojis/2', '/guilds/1/roles', '/guilds/3/emojis'):
+        cache.put(Route('GET', path), None, [])
+
+    assert cache.invalidate(Route('DELETE', '/guilds/1/emojis/2')) == 3
+    assert cache.get(Route('GET', '/guilds/1/roles')) == []
+    assert cache.get(Route('GET', '/guilds/3/emojis')) == []
+    assert cache.get(Route('GET', '/guilds/1/emojis')) is MISSING
+
+
+def test_invalidation_rules_evict_other_paths():
+    cache = ResponseCache()
+    cache.put(Route('GET', '/guilds/1/channels'), None, [])
+
+    assert cache.invalidate(Route('DELETE', '/channels/2')) == 1
+
+
+def test_responses_invalidated_in_flight_are_not_cached():
+    cache = ResponseCache()
+    route = Route('GET', '/guilds/1/emojis')
+
+    generation = cache.begin(route)
+    cache.invalidate(Route('DELETE', '/guilds/1/emojis/2'))
+    cache.put(route, None, ['stale'], generation)
+    cache.end(route)
+    assert cache.get(route) is MISSING
+
+    generation = cache.begin(route)
+    cache.put(route, None, ['fresh'], generation)
+    cache.end(route)
+    assert cache.get(route) == ['fresh']
+
+
+class SlowEmojis(FakeDiscord):
+
+    async def get_emojis(self, request):
+        await asyncio.sleep(0.1)
+        return await super().get_emojis(request)
+
+
+async def test_gets_after_a_mutation_do_not_join_gets_before_it():
+    cache = ResponseCache()
+    async with serve(SlowEmojis()) as server:
+        async with RestCord(token='token', cache=cache) as client:
+            emojis = client.emoji_client
+            before = asyncio.ensure_future(emojis.get_emojis(1))
+            await asyncio.sleep(0.01)
+            await emojis.delete_emoji(1, 2)
+
+            # Neither joins the GET sent before the delete nor is answered with its response from the cache.
+            after = asyncio.ensure_future(emojis.get_emojis(1))
+            await before
+            await after
+            assert server.requests == 3
+
+            await emojis.get_emojis(1)
+            assert server.requests == 3
+
+
+async def test_coalesced_gets_count_one_miss():
+    cache = ResponseCache()
+    async with serve(FakeDiscord(latency=0.02)) as server:
+        async with RestCord(token='token', cache=cache) as client:
+            await asyncio.gather(*(client.guild_client.get_roles(1) for _ in range(50)))
+
+    assert server.requests == 1
+    assert (cache.hits, cache.misses) == (0, 1)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from restcord import MemberTable
+
+
+def member(user_id: int) -> dict:
+    return {'user': {'id': str(user_id), 'username': f'user {user_id}', 'discriminator': '0001'}, 'roles': ['10', '20'],
+            'joined_at': '2020-01-01T00:00:00+00:00', 'mute': False, 'deaf': user_id % 2 == 0}
+
+
+def test_rows_read_back_what_was_appended():
+    table = MemberTable(member(i) for i in range(1, 4))
+
+    assert len(table) == 3
+    assert table.column('id') == [1, 2, 3]
+    assert table[-1].name == 'user 3'
+    assert table[1].roles == [10, 20]
+    assert table.column('deaf') == [False, True, False]
+
+
+def test_an_exported_table_is_frozen_without_leaving_the_columns_uneven():
+    table = MemberTable([member(1), member(2)])
+    buffers = table.buffers()
+
+    with pytest.raises(BufferError):
+        table.append(member(3))
+
+    assert len(table) == 2
+    assert {len(table.column(name)) for name in table.columns} == {2}
+    assert bytes(buffers['id']['data']) == (1).to_bytes(8, 'little') + (2).to_bytes(8, 'little')
+
+
+def test_a_malformed_payload_leaves_the_columns_even():
+    table = MemberTable([member(1)])
+    malformed = dict(member(2), joined_at='garbage')
+
+    with pytest.raises(ValueError):
+        table.append(malformed)
+
+    table.append(member(3))
+    assert {len(table.columns[name]) for name in table.columns} == {2}
+    assert table.column('id') == [1, 3]
+    assert table[1].joined_at.year == 2020
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from restcord import Channel, IdentityMap, Member, Message, User
+
+
+def member(nick: str, joined_at: str) -> dict:
+    return {'user': {'id': '1', 'username': 'user'}, 'nick': nick, 'joined_at': joined_at}
+
+
+def test_models_with_the_same_type_and_id_are_shared():
+    with IdentityMap():
+        first = Message.from_dict({'id': '1', 'author': {'id': '2', 'username': 'before'}})
+        second = Message.from_dict({'id': '1', 'author': {'id': '2', 'username': 'after'}})
+
+        assert first is second
+        assert first.author is User.from_dict({'id': '2', 'username': 'after'})
+        assert first.author.name == 'after'
+
+
+def test_members_of_different_guilds_are_not_shared():
+    with IdentityMap():
+        a = Member.from_dict(member('in guild a', '2020-01-01T00:00:00+00:00'))
+        b = Member.from_dict(member('in guild b', '2021-01-01T00:00:00+00:00'))
+
+        assert a is not b
+        assert a.nick == 'in guild a'
+        assert a.joined_at.year == 2020
+
+
+def test_permission_overwrites_of_different_channels_are_not_shared():
+    with IdentityMap():
+        first = Channel.from_dict({'id': '1', 'permission_overwrites': [{'id': '3', 'type': 'role', 'allow': 8, 'deny': 0}]})
+        second = Channel.from_dict({'id': '2', 'permission_overwrites': [{'id': '3', 'type': 'role', 'allow': 0, 'deny': 8}]})
+
+        first_overwrite, = first.permission_overwrites
+        second_overwrite, = second.permission_overwrites
+
+        assert first_overwrite is not second_overwrite
+        assert (first_overwrite.allow, first_overwrite.deny) == (8, 0)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from benchmarks.fake_discord import FakeDiscord
+from restcord import RestCord
+from restcord.iterators import ReactionIterator
+
+from .helpers import serve
+
+
+class Pages:
+
+    """Stands in for a ChannelClient, returning each of ``pages`` in turn."""
+
+    def __init__(self, *pages) -> None:
+        self.pages = list(pages)
+        self.requests = 0
+
+    async def _get_reactions_data(self, channel_id, message_id, emoji, after=None, limit=25):
+        self.requests += 1
+        return self.pages.pop(0) if self.pages else []
+
+
+def users(start: int, count: int) -> list:
+    return [{'id': str(i), 'username': f'user{i}'} for i in range(start, start + count)]
+
+
+async def test_pages_filtered_to_nothing_do_not_end_iteration():
+    client = Pages(users(1, 100), users(1, 100), users(101, 50))
+
+    assert await ReactionIterator(client, 1, 2, 'emoji', unique=True).count() == 150
+    assert client.requests == 3
+
+
+async def test_limit_counts_yielded_items():
+    client = Pages(users(1, 100), users(1, 100), users(101, 100))
+
+    users_yielded = await ReactionIterator(client, 1, 2, 'emoji', limit=120, unique=True, prefetch=False).flatten()
+
+    assert [user.id for user in users_yielded] == list(range(1, 121))
+
+
+async def test_concurrent_identical_iterators_do_not_share_mutations():
+    async with serve(FakeDiscord(messages=500)):
+        async with RestCord(token='token') as client:
+            channel = client.channel_client
+            first, second = await asyncio.gather(*(channel.iter_messages(1, after=1, limit=200).flatten() for _ in range(2)))
+
+    ids = [message.id for message in first]
+    assert len(set(ids)) == 200 and ids == sorted(ids)
+    assert [message.id for message in second] == ids
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from restcord import MetricsCollector
+from restcord.http import Route
+
+
+def test_templates_mask_parameters_that_are_not_ids():
+    assert Route('GET', '/channels/1/messages/2').template == '/channels/{id}/messages/{id}'
+    assert Route('DELETE', '/webhooks/1/s3cr3t-t0k3n').template == '/webhooks/{id}/{token}'
+    assert Route('PUT', '/channels/1/messages/2/reactions/%F0%9F%91%8D/@me').template == '/channels/{id}/messages/{id}/reactions/{emoji}/@me'
+    assert Route('DELETE', '/channels/1/messages/2/reactions/wave%3A3/4').template == '/channels/{id}/messages/{id}/reactions/{emoji}/{id}'
+    assert Route('GET', '/invites/discord-api').template == '/invites/{code}'
+
+
+def test_buckets_are_keyed_by_template_and_major_parameter():
+    assert Route('GET', '/channels/1/messages/2').bucket == Route('GET', '/channels/1/messages/3').bucket
+    assert Route('GET', '/channels/1/messages/2').bucket != Route('GET', '/channels/2/messages/2').bucket
+    assert 's3cr3t' not in Route('DELETE', '/webhooks/1/s3cr3t').bucket
+
+
+def test_rendered_metrics_have_no_secrets_or_bucket_keys():
+    metrics = MetricsCollector()
+    webhook = Route('DELETE', '/webhooks/1/s3cr3t-t0k3n')
+    invite = Route('GET', '/invites/discord-api')
+    metrics.on_response(webhook, 429, 0.1, 0.0, 10, 0)
+    metrics.on_ratelimit(webhook, 'abcdef:1', 1.0, False)
+    metrics.on_error(webhook, RuntimeError())
+    metrics.on_response(invite, 200, 0.1, 0.0, 10, 0)
+
+    rendered = metrics.render()
+    assert 's3cr3t' not in rendered
+    assert 'discord-api' not in rendered
+    assert 'abcdef' not in rendered
+    assert 'route="/webhooks/{id}/{token}"' in rendered
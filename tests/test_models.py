@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from benchmarks.fake_discord import FakeDiscord
+from restcord import Channel, Emoji, Guild, IdentityMap, Message, RestCord, Role, User, VoiceRegion
+from restcord.model import lazy
+
+from .helpers import serve
+
+
+def test_referenced_ids_are_ints():
+    channel = Channel.from_dict({'id': '1', 'guild_id': '2', 'parent_id': '3', 'last_message_id': '4', 'name': 'general'})
+    message = Message.from_dict({'id': '4', 'channel_id': '1', 'content': 'hi'})
+    guild = Guild.from_dict({'id': '2', 'owner_id': '5', 'system_channel_id': '1', 'afk_channel_id': None})
+    emoji = Emoji.from_dict({'id': '6', 'name': 'wave', 'roles': ['2', '7']})
+
+    assert (channel.guild_id, channel.parent_id, channel.last_message_id) == (2, 3, 4)
+    assert message.channel_id == channel.id
+    assert guild.owner_id == 5 and guild.system_channel_id == channel.id and guild.afk_channel_id is None
+    assert emoji.roles == [2, 7]
+
+
+def test_models_are_equal_by_type_and_id():
+    guild = Guild.from_dict({'id': '2', 'name': 'guild'})
+    everyone = Role.from_dict({'id': '2', 'name': '@everyone'})
+
+    assert guild != everyone
+    assert len({guild, everyone}) == 2
+    assert Role.from_dict({'id': '2'}) == everyone
+    assert User.from_dict({'id': '2'}) != everyone
+
+
+def test_voice_regions_keep_their_name_as_id():
+    data = {'id': 'us-west', 'name': 'US West', 'vip': False, 'optimal': True, 'deprecated': False, 'custom': False}
+    region = VoiceRegion.from_dict(data)
+
+    assert region.id == 'us-west' and region.optimal
+    assert region == VoiceRegion.from_dict({'id': 'us-west'})
+
+    with IdentityMap():
+        assert VoiceRegion.from_dict(data) is VoiceRegion.from_dict(data)
+
+
+async def test_voice_regions_are_requested():
+    async with serve(FakeDiscord()):
+        async with RestCord(token='token') as client:
+            regions = await client.voice_client.get_voice_regions()
+
+    assert regions and all(isinstance(region.id, str) for region in regions)
+
+
+def test_models_are_built_eagerly_unless_lazy():
+    data = {'id': '4', 'author': {'id': '2', 'username': 'author'}, 'timestamp': '2020-01-01T00:00:00+00:00'}
+
+    message = Message.from_dict(data)
+    assert message._data is None
+    assert message.author.name == 'author' and message.timestamp.year == 2020
+
+    with lazy():
+        message = Message.from_dict(data)
+        guild = Guild(id='2', roles=[{'id': '2', 'name': '@everyone'}])
+    assert message._data is data and guild._data is not None
+    assert message.author.name == 'author'
+    assert [role.name for role in guild.roles] == ['@everyone']
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+
+from benchmarks.fake_discord import FakeDiscord
+from restcord import RateLimited, RestCord
+from restcord.http import Route
+from restcord.ratelimit import Bucket, RateLimiter
+
+from .helpers import serve
+
+
+async def test_bucket_waits_for_the_window_to_reset():
+    bucket = Bucket('GET /channels/1/messages')
+    await bucket.acquire()
+    bucket.update({'X-Ratelimit-Limit': '1', 'X-Ratelimit-Remaining': '0', 'X-Ratelimit-Reset-After': '0.05'})
+    bucket.release()
+
+    waited = await bucket.acquire()
+    bucket.release()
+
+    assert waited >= 0.04
+
+
+async def test_bucket_waits_for_the_first_response():
+    bucket = Bucket('GET /channels/1/messages')
+    await bucket.acquire()
+
+    second = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0.01)
+    assert not second.done()
+
+    bucket.update({'X-Ratelimit-Limit': '5', 'X-Ratelimit-Remaining': '4', 'X-Ratelimit-Reset-After': '1'})
+    bucket.release()
+    await second
+    bucket.release()
+
+    assert bucket.remaining == 3
+
+
+async def test_concurrent_requests_are_not_ratelimited():
+    async with serve(FakeDiscord(messages=10, window_scale=0.02)) as server:
+        async with RestCord(token='token', ratelimiter=RateLimiter(global_limit=1000)) as client:
+            # Distinct requests, so that they are not coalesced into one.
+            await asyncio.gather(*(client.channel_client.get_messages(1, limit=i) for i in range(1, 21)))
+
+    assert server.requests == 20
+    assert server.ratelimited == 0
+
+
+async def test_idle_buckets_are_pruned():
+    limiter = RateLimiter()
+    async with serve(FakeDiscord(messages=10, window_scale=0.01)):
+        async with RestCord(token='token', ratelimiter=limiter) as client:
+            for channel_id in range(1, 11):
+                await client.channel_client.get_messages(channel_id, limit=1)
+
+            assert len(limiter) >= 10
+
+            # Windows are 50 milliseconds long, so every bucket is idle a second later.
+            assert limiter.prune(time.monotonic() + 1) >= 10
+            assert len(limiter) == 0
+
+            messages = await client.channel_client.get_messages(1, limit=1)
+            assert len(messages) == 1
+
+
+def test_buckets_in_use_or_in_their_window_are_kept():
+    limiter = RateLimiter()
+    route = Route('GET', '/channels/1/messages')
+    bucket = limiter.get_bucket(route)
+    bucket.exhaust(10)
+
+    assert limiter.prune() == 0
+    assert limiter.get_bucket(route) is bucket
+    assert limiter.prune(time.monotonic() + 11) == 1
+    assert limiter.get_bucket(route) is not bucket
+
+
+async def test_reserved_buckets_are_kept():
+    limiter = RateLimiter()
+    route = Route('GET', '/channels/1/messages')
+    bucket = limiter.get_bucket(route)
+    await bucket.acquire()
+
+    assert limiter.prune() == 0
+
+    bucket.release()
+    assert limiter.prune() == 1
+
+
+async def test_retries_wait_as_long_as_the_fake_server_asks():
+    async with serve(FakeDiscord(spurious_429=1.0, window_scale=0.1)):
+        async with RestCord(token='token', max_retries=1, retry_jitter=0) as client:
+            start = time.monotonic()
+            try:
+                await client.channel_client.get_messages(1)
+            except RateLimited as e:
+                # 5 requests per 0.5 seconds, so each spurious 429 asks for 0.1 seconds.
+                assert abs(e.retry_after - 0.1) < 0.01
+            else:
+                raise AssertionError('Expected RateLimited')
+
+    assert time.monotonic() - start >= 0.1
+
+
+async def test_a_new_window_restores_the_remaining_count():
+    bucket = Bucket('GET /channels/1/messages')
+    for remaining in (4, 3, 2, 1):
+        await bucket.acquire()
+        bucket.update({'X-Ratelimit-Limit': '5', 'X-Ratelimit-Remaining': str(remaining), 'X-Ratelimit-Reset': '1000.0',
+                       'X-Ratelimit-Reset-After': '0.05'})
+        bucket.release()
+
+    await asyncio.sleep(0.06)
+
+    # The first window has ended with one request to spare, and the next response reports the new window's count.
+    await bucket.acquire()
+    bucket.update({'X-Ratelimit-Limit': '5', 'X-Ratelimit-Remaining': '4', 'X-Ratelimit-Reset': '1000.5',
+                   'X-Ratelimit-Reset-After': '0.5'})
+    bucket.release()
+    assert bucket.remaining == 4
+
+    waited = await bucket.acquire()
+    bucket.release()
+    assert waited < 0.1
+
+
+async def test_a_new_window_does_not_count_requests_in_flight_twice():
+    bucket = Bucket('GET /channels/1/messages')
+    await bucket.acquire()
+    bucket.update({'X-Ratelimit-Limit': '5', 'X-Ratelimit-Remaining': '3', 'X-Ratelimit-Reset': '1000.0',
+                   'X-Ratelimit-Reset-After': '10'})
+    bucket.release()
+    for _ in range(3):
+        await bucket.acquire()
+
+    # One of the three responses arrives from a later window, while the other two may not have been counted yet.
+    bucket.update({'X-Ratelimit-Limit': '5', 'X-Ratelimit-Remaining': '4', 'X-Ratelimit-Reset': '1010.0',
+                   'X-Ratelimit-Reset-After': '10'})
+    assert bucket.remaining == 2
+    for _ in range(3):
+        bucket.release()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from restcord import Priority, RequestScheduler
+
+
+async def test_requests_beyond_the_limit_wait_for_a_release():
+    scheduler = RequestScheduler(max_in_flight=2)
+    await scheduler.acquire()
+    await scheduler.acquire()
+
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert (scheduler.in_flight, scheduler.queued) == (2, 1)
+
+    scheduler.release()
+    await waiter
+    assert (scheduler.in_flight, scheduler.queued) == (2, 0)
+
+
+async def test_waiting_requests_are_admitted_by_priority_then_arrival():
+    scheduler = RequestScheduler(max_in_flight=1)
+    await scheduler.acquire()
+
+    admitted = []
+
+    async def request(name: str, level: Priority):
+        await scheduler.acquire(level)
+        admitted.append(name)
+        scheduler.release()
+
+    tasks = [asyncio.ensure_future(request(name, level)) for name, level in (
+        ('bulk 1', Priority.BULK), ('default', Priority.DEFAULT), ('bulk 2', Priority.BULK), ('interactive', Priority.INTERACTIVE)
+    )]
+    await asyncio.sleep(0)
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert admitted == ['interactive', 'default', 'bulk 1', 'bulk 2']
+    assert scheduler.in_flight == 0
+
+
+async def test_cancelled_waiters_do_not_keep_a_slot():
+    scheduler = RequestScheduler(max_in_flight=1)
+    await scheduler.acquire()
+
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    scheduler.release()
+    assert scheduler.in_flight == 0
+    assert await scheduler.acquire() == 0.0
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import random
+
+import pytest
+
+from benchmarks.fake_discord import FakeDiscord
+from restcord import RequestScheduler, RestCord
+from restcord.stream import JSONArrayDecoder
+
+from .helpers import serve
+
+
+def decode(body: bytes, rng: random.Random) -> list:
+    decoder = JSONArrayDecoder()
+    elements = []
+    pos = 0
+    while pos < len(body):
+        size = rng.randint(1, 16)
+        elements.extend(decoder.feed(body[pos:pos + size]))
+        pos += size
+    decoder.close()
+    return elements
+
+
+def test_elements_split_across_chunks_are_decoded():
+    rng = random.Random(0)
+    array = [1, -2.5, 1.5e3, 'café ☃', '', None, True, False, [], {}, [1, [2, {'a': 'b]'}]], {'text': 'a, b] c'}]
+    body = json.dumps(array, indent=1).encode('utf-8')
+
+    for _ in range(200):
+        assert decode(body, rng) == array
+
+    assert decode(b' [ ] ', rng) == []
+
+
+@pytest.mark.parametrize('body', [b'{"a": 1}', b'[1, 2', b'[1 2]', b'[1,]', b'[1] x', b''])
+def test_malformed_arrays_raise(body):
+    decoder = JSONArrayDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(body)
+        decoder.close()
+
+
+async def test_requests_can_be_made_while_streaming():
+    scheduler = RequestScheduler(max_in_flight=1)
+    async with serve(FakeDiscord(members=20)):
+        async with RestCord(token='token', scheduler=scheduler) as client:
+            async def consume():
+                users = []
+                members = client.guild_client.stream_members(1, limit=5)
+                try:
+                    async for member in members:
+                        users.append(await client.user_client.get_user(member.id))
+                finally:
+                    await members.aclose()
+                return users
+
+            users = await asyncio.wait_for(consume(), 5)
+
+    assert len(users) == 5
+    assert scheduler.in_flight == 0
+
+
+async def test_many_streams_do_not_exhaust_the_scheduler():
+    scheduler = RequestScheduler(max_in_flight=4)
+    async with serve(FakeDiscord(members=20)):
+        async with RestCord(token='token', scheduler=scheduler) as client:
+            async def consume(guild_id: int):
+                count = 0
+                members = client.guild_client.stream_members(guild_id, limit=2)
+                try:
+                    async for member in members:
+                        await client.user_client.get_user(member.id)
+                        count += 1
+                finally:
+                    await members.aclose()
+                return count
+
+            counts = await asyncio.wait_for(asyncio.gather(*(consume(guild_id) for guild_id in range(1, 26))), 10)
+
+    assert counts == [2] * 25
+    assert scheduler.in_flight == 0